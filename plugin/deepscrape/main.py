@@ -6,7 +6,7 @@ Command:
 
 Behavior:
   - Uses OpenAI to interpret platforms and depth intent
-  - Performs vision-assisted web search collection to gather results
+  - Reads search results from the page DOM, falling back to vision when selectors miss
   - Depth controls how much detail to extract from result pages
   - Timeout stops the operation regardless of progress
   - Writes CSV to ./data/deepscrape_<term>.csv
@@ -14,42 +14,179 @@ Behavior:
 
 import os
 import re
+import io
 import csv
+import json
 import time
+import atexit
 import asyncio
-import base64
-from typing import List, Dict, Tuple
+import binascii
+import hashlib
+import functools
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime
+from urllib.parse import quote_plus, urlsplit, urlunsplit, parse_qsl, urlencode
 
 try:
-    from playwright.async_api import async_playwright
-    from openai import OpenAI
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+    import httpx
+    from openai import AsyncOpenAI
+    from PIL import Image
     DEPENDENCIES_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: DeepScrape plugin dependencies not available: {e}")
     DEPENDENCIES_AVAILABLE = False
 
+try:
+    # Optional faster JSON parser
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional SIMD-accelerated encoder
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+    def _b64encode(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode('ascii')
+
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
 USER_DATA_DIR = os.path.join(DATA_DIR, 'deepscrape_user')
 
+# Max detail pages analyzed at once (bounds tabs and concurrent OpenAI calls)
+DETAIL_CONCURRENCY = 8
+
+# Resource types aborted on detail tabs (the SERP tab keeps full layout)
+DETAIL_BLOCKED_RESOURCES = frozenset({'image', 'media', 'font'})
+
+# Screenshots sent to vision are JPEG, capped to this longest side
+SCREENSHOT_MAX_SIDE = 1024
+SCREENSHOT_QUALITY = 75
+
+# Results container per engine, used to crop SERP screenshots
+RESULTS_CONTAINER_SELECTORS = {
+    'google': '#rso, #search',
+    'bing': '#b_results, #b_content',
+    'duckduckgo': '[data-testid="mainline"], #links',
+}
+
+# Visible part of the first matching element, in viewport coordinates
+_CLIP_SCRIPT = """(sel) => {
+    const el = document.querySelector(sel);
+    if (!el) return null;
+    const r = el.getBoundingClientRect();
+    const x = Math.max(0, r.left);
+    const y = Math.max(0, r.top);
+    const width = Math.min(window.innerWidth, r.right) - x;
+    const height = Math.min(window.innerHeight, r.bottom) - y;
+    if (width < 50 || height < 50) return null;
+    return {x, y, width, height};
+}"""
+
+# Result cards per engine; extractors map them to records, scrolling waits on their count
+RESULT_CARD_SELECTORS = {
+    'google': 'div.SoaBEf, #rso div.g',
+    'bing': 'div.news-card, #b_results li.b_algo',
+    'duckduckgo': 'article[data-testid="result"], #links .result',
+}
+
+# DOM extractors per engine, called with the card selector;
+# each returns [{title, url, excerpt, publisher, date, rank}]
+_EXTRACTORS = {
+    'google': """(sel) => {
+        const text = (el, sel) => (el.querySelector(sel)?.innerText || '').trim();
+        const cards = document.querySelectorAll(sel);
+        return Array.from(cards).map((el, i) => ({
+            title: text(el, 'div[role="heading"], h3'),
+            url: el.querySelector('a[href^="http"]')?.href || '',
+            excerpt: text(el, '.GI74Re, [data-sncf], .VwiC3b'),
+            publisher: text(el, '.MgUUmf, cite'),
+            date: text(el, '.OSrXXb, .LfVVr'),
+            rank: i + 1,
+        })).filter(r => r.title && r.url);
+    }""",
+    'bing': """(sel) => {
+        const text = (el, sel) => (el.querySelector(sel)?.innerText || '').trim();
+        const cards = document.querySelectorAll(sel);
+        return Array.from(cards).map((el, i) => ({
+            title: el.getAttribute('data-title') || text(el, 'a.title, h2'),
+            url: el.getAttribute('url') || el.querySelector('a.title, h2 a')?.href || '',
+            excerpt: text(el, '.snippet, .b_caption p'),
+            publisher: el.getAttribute('data-author') || text(el, '.source a, cite'),
+            date: text(el, '.source span[aria-label], .news_dt'),
+            rank: i + 1,
+        })).filter(r => r.title && r.url);
+    }""",
+    'duckduckgo': """(sel) => {
+        const text = (el, sel) => (el.querySelector(sel)?.innerText || '').trim();
+        const cards = document.querySelectorAll(sel);
+        return Array.from(cards).map((el, i) => ({
+            title: text(el, '[data-testid="result-title-a"], a.result__a'),
+            url: el.querySelector('[data-testid="result-title-a"], a.result__a')?.href || '',
+            excerpt: text(el, '[data-result="snippet"], .result__snippet'),
+            publisher: text(el, '[data-testid="result-extras-url-link"], .result__url'),
+            date: '',
+            rank: i + 1,
+        })).filter(r => r.title && r.url);
+    }""",
+}
+
 
 def _ensure_dirs():
     os.makedirs(DATA_DIR, exist_ok=True)
     os.makedirs(USER_DATA_DIR, exist_ok=True)
 
 
+_SANI_NONWORD = re.compile(r'[^\w\s-]')
+_SANI_COLLAPSE = re.compile(r'[-\s]+')
+
+
 def _sanitize_filename(text: str) -> str:
-    sanitized = re.sub(r'[^\w\s-]', '', text)
-    sanitized = re.sub(r'[-\s]+', '_', sanitized).strip('_')
-    return sanitized[:60] if sanitized else 'results'
+    sanitized = _SANI_COLLAPSE.sub('_', _SANI_NONWORD.sub('', text)).strip('_')
+    return sanitized[:60] or 'results'
+
+
+# (event loop, client): httpx connection pools are bound to the loop that created them
+_OAI: Optional[Tuple[asyncio.AbstractEventLoop, "AsyncOpenAI"]] = None
 
 
 def _get_openai():
+    """Shared AsyncOpenAI client for the running event loop; must be called from a coroutine."""
+    global _OAI
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         return None
-    return OpenAI(api_key=api_key)
+    loop = asyncio.get_running_loop()
+    if _OAI is None or _OAI[0] is not loop:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        _OAI = (loop, AsyncOpenAI(api_key=api_key, http_client=http_client))
+    return _OAI[1]
+
+
+_JD = json.JSONDecoder()
+
+
+def _first_json(text: str, opener: str):
+    """Decode the first JSON value starting at `opener` ('{' or '[') in an LLM reply.
+    Returns None when absent or malformed."""
+    start = text.find(opener) if text else -1
+    if start == -1:
+        return None
+    # Fast path: the reply is just JSON (possibly after a preamble)
+    try:
+        return _json_loads(text if start == 0 else text[start:])
+    except ValueError:
+        pass
+    # Trailing chatter or code fences: parse in place from the offset
+    try:
+        obj, _ = _JD.raw_decode(text, start)
+    except ValueError:
+        return None
+    return obj
 
 
 def _strict_yes_no(text: str) -> bool:
@@ -76,7 +213,7 @@ def _format_candidate_for_llm(title: str, excerpt: str, url: str) -> str:
     return "\n".join(parts)
 
 
-def _is_relevant(term: str, title: str, excerpt: str, url: str) -> bool:
+async def _is_relevant(term: str, title: str, excerpt: str, url: str) -> bool:
     """Use OpenAI (text) to decide if a candidate result is relevant to the term.
     For multi-word terms (e.g., names like "Imtiaz Al Shariar"), prefer exact phrase presence.
     """
@@ -97,7 +234,7 @@ Answer with ONLY 'yes' or 'no'.
 Candidate:\n{content}
 """
         try:
-            r = client.chat.completions.create(
+            r = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=3,
@@ -122,7 +259,7 @@ Candidate:
 Question: Is this candidate relevant to the topic in a way that would likely satisfy a user searching for this topic? Answer only 'yes' or 'no'.
 """
     try:
-        r = client.chat.completions.create(
+        r = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=3,
@@ -134,16 +271,100 @@ Question: Is this candidate relevant to the topic in a way that would likely sat
         return True
 
 
-async def _take_screenshot(page) -> bytes:
-    return await page.screenshot()
+async def _take_screenshot(page, clip: Optional[Dict] = None,
+                           max_side: int = SCREENSHOT_MAX_SIDE,
+                           quality: int = SCREENSHOT_QUALITY) -> "_Shot":
+    """Capture a JPEG screenshot, downscaled so its longest side is at most max_side."""
+    raw = await page.screenshot(type="jpeg", quality=quality, clip=clip, full_page=False)
+    img = Image.open(io.BytesIO(raw))
+    if max(img.size) <= max_side:
+        return _Shot(raw)
+    img.thumbnail((max_side, max_side))
+    buf = io.BytesIO()
+    img.convert('RGB').save(buf, format='JPEG', quality=quality)
+    return _Shot(buf.getvalue())
+
+
+async def _results_clip(page, engine: str) -> Optional[Dict]:
+    """Bounding box of the visible results container, or None to capture the viewport."""
+    selector = RESULTS_CONTAINER_SELECTORS.get(engine.lower(), RESULTS_CONTAINER_SELECTORS['duckduckgo'])
+    try:
+        return await page.evaluate(_CLIP_SCRIPT, selector)
+    except Exception:
+        return None
+
+
+def _shot_digest(image_bytes: bytes) -> bytes:
+    """Cheap content hash used to spot screenshots that were already analyzed."""
+    return hashlib.blake2b(image_bytes, digest_size=16).digest()
 
 
 def _b64(image_bytes: bytes) -> str:
-    return base64.b64encode(image_bytes).decode('utf-8')
+    return _b64encode(image_bytes)
+
+
+class _Shot:
+    """Screenshot bytes whose base64 text and digest are computed at most once."""
+
+    __slots__ = ('raw', '_b64', '_hash')
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._b64 = None
+        self._hash = None
+
+    @property
+    def b64(self) -> str:
+        if self._b64 is None:
+            self._b64 = _b64(self.raw)
+        return self._b64
+
+    @property
+    def hash(self) -> bytes:
+        if self._hash is None:
+            self._hash = _shot_digest(self.raw)
+        return self._hash
+
+
+def _image_part(shot: _Shot, detail: Optional[str] = None) -> Dict:
+    """Chat message content part carrying a JPEG screenshot as a data URL."""
+    image_url = {"url": "data:image/jpeg;base64," + shot.b64}
+    if detail:
+        image_url["detail"] = detail
+    return {"type": "image_url", "image_url": image_url}
+
+
+# Engine names recognized directly in --platforms, which make the planner call unnecessary
+_ENGINE_HINT_RE = re.compile(r'\b(google|bing|duckduckgo|ddg)\b', re.IGNORECASE)
+_ENGINE_ALIASES = {'ddg': 'duckduckgo'}
+# LLM plans per (term, hint, depth) for the life of the process
+_PLAN_CACHE: Dict[Tuple[str, str, int], Dict] = {}
+
+
+def _plan_from_hint(platforms_hint: str) -> Optional[Dict]:
+    engines = []
+    for m in _ENGINE_HINT_RE.finditer(platforms_hint or ''):
+        engine = m.group(1).lower()
+        engine = _ENGINE_ALIASES.get(engine, engine)
+        if engine not in engines:
+            engines.append(engine)
+    if not engines:
+        return None
+    return {
+        'targets': [{'engine': e, 'reason': 'requested in platforms hint'} for e in engines],
+        'strategy': 'Use the engines named in the platforms hint.'
+    }
 
 
 async def _analyze_platforms_and_plan(term: str, platforms_hint: str, depth: int) -> Dict:
-    """Use OpenAI (text) to plan which sources to target and what to extract per depth."""
+    """Use OpenAI (text) to plan which sources to target and what to extract per depth.
+    Skipped when the hint already names engines; LLM plans are cached per process."""
+    plan = _plan_from_hint(platforms_hint)
+    if plan:
+        return plan
+    cache_key = (term, platforms_hint, depth)
+    if cache_key in _PLAN_CACHE:
+        return _PLAN_CACHE[cache_key]
     client = _get_openai()
     if not client:
         return {
@@ -174,17 +395,15 @@ Return JSON with fields:
 Only return JSON.
 """
     try:
-        r = client.chat.completions.create(
+        r = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=400
         )
-        txt = r.choices[0].message.content
-        start = txt.find('{')
-        end = txt.rfind('}') + 1
-        if start != -1 and end > start:
-            import json
-            return json.loads(txt[start:end])
+        plan = _first_json(r.choices[0].message.content, '{')
+        if isinstance(plan, dict):
+            _PLAN_CACHE[cache_key] = plan
+            return plan
     except Exception:
         pass
     return {
@@ -195,24 +414,75 @@ Only return JSON.
     }
 
 
+_SEARCH_URLS = {
+    'google': "https://www.google.com/search?q={q}&tbm=nws",
+    'bing': "https://www.bing.com/news/search?q={q}",
+    'duckduckgo': "https://duckduckgo.com/?q={q}&t=h_&ia=web",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def _search_url(engine: str, term: str) -> str:
     # Use exact-phrase search for multi-word terms to reduce false positives
     qterm = f'"{term}"' if ' ' in term.strip() else term
-    q = qterm.replace(' ', '+')
-    e = engine.lower()
-    if e == 'google':
-        return f"https://www.google.com/search?q={q}&tbm=nws"
-    if e == 'bing':
-        return f"https://www.bing.com/news/search?q={q}"
-    return f"https://duckduckgo.com/?q={q}&t=h_&ia=web"
+    template = _SEARCH_URLS.get(engine.lower(), _SEARCH_URLS['duckduckgo'])
+    return template.format(q=quote_plus(qterm))
 
 
-async def _extract_search_results_via_vision(page, engine: str) -> List[Dict]:
+def _dedup_key(url: str) -> str:
+    """URL with utm_* trackers and the fragment removed, for cross-scroll/engine dedup."""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not k.lower().startswith('utm_')])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+async def _scroll_for_more(page, engine: str):
+    """Scroll down and return as soon as more result cards are in the DOM (max ~2.5s)."""
+    selector = RESULT_CARD_SELECTORS.get(engine.lower(), RESULT_CARD_SELECTORS['duckduckgo'])
+    try:
+        prev_count = await page.evaluate("(sel) => document.querySelectorAll(sel).length", selector)
+    except Exception:
+        prev_count = 0
+    await page.evaluate('window.scrollBy(0, document.body.scrollHeight)')
+    try:
+        await page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length > n",
+            arg=[selector, prev_count],
+            timeout=2500,
+        )
+    except PlaywrightTimeoutError:
+        # No new cards (end of results or unknown markup); short settle for the vision fallback
+        await asyncio.sleep(0.5)
+
+
+async def _extract_search_results(page, engine: str, seen_hashes: Optional[set] = None) -> List[Dict]:
+    """Read results straight from the SERP DOM; fall back to vision when nothing matches."""
+    e = engine.lower() if engine.lower() in _EXTRACTORS else 'duckduckgo'
+    try:
+        results = await page.evaluate(_EXTRACTORS[e], RESULT_CARD_SELECTORS[e])
+    except Exception:
+        results = []
+    if results:
+        return results
+    return await _extract_search_results_via_vision(page, engine, seen_hashes)
+
+
+async def _extract_search_results_via_vision(page, engine: str, seen_hashes: Optional[set] = None) -> List[Dict]:
     client = _get_openai()
     if not client:
         return []
-    shot = await _take_screenshot(page)
-    b64 = _b64(shot)
+    shot = await _take_screenshot(page, clip=await _results_clip(page, engine))
+    if seen_hashes is not None:
+        # Page did not change since a previous round (e.g. lazy-load stalled)
+        h = shot.hash
+        if h in seen_hashes:
+            print("[deepscrape] unchanged SERP screenshot, skipping vision call")
+            return []
+        seen_hashes.add(h)
     if engine.lower() == 'google':
         engine_prompt = 'Analyze this Google search results page.'
     elif engine.lower() == 'bing':
@@ -225,23 +495,20 @@ async def _extract_search_results_via_vision(page, engine: str) -> List[Dict]:
 Only return the JSON array.
 """
     try:
-        r = client.chat.completions.create(
+        r = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{
                 "role": "user",
                 "content": [
                     {"type": "text", "text": prompt},
-                    {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}}
+                    _image_part(shot, detail="low")
                 ]
             }],
             max_tokens=2500
         )
-        content = r.choices[0].message.content
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        if start != -1 and end > start:
-            import json
-            return json.loads(content[start:end])
+        results = _first_json(r.choices[0].message.content, '[')
+        if isinstance(results, list):
+            return results
     except Exception:
         return []
     return []
@@ -256,10 +523,16 @@ async def _analyze_page_depth(page, url: str, depth: int) -> Dict:
     if not client:
         return data
     try:
-        await page.goto(url, wait_until="domcontentloaded")
-        await asyncio.sleep(2)
+        # Screenshot whatever has rendered by then rather than waiting on slow assets
+        try:
+            await page.goto(url, wait_until="commit", timeout=8000)
+        except PlaywrightTimeoutError:
+            pass
+        try:
+            await page.wait_for_load_state("networkidle", timeout=1500)
+        except PlaywrightTimeoutError:
+            pass
         shot = await _take_screenshot(page)
-        b64 = _b64(shot)
         prompt = f"""
 Extract information from this page screenshot as JSON with keys:
 "url", "title", "author", "date", "summary", "has_comments", "comments".
@@ -270,23 +543,19 @@ Depth = {depth}:
 Only return the JSON object.
 URL: {url}
 """
-        r = client.chat.completions.create(
+        r = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{
                 "role": "user",
                 "content": [
                     {"type": "text", "text": prompt},
-                    {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}}
+                    _image_part(shot)
                 ]
             }],
             max_tokens=2000
         )
-        content = r.choices[0].message.content
-        start = content.find('{')
-        end = content.rfind('}') + 1
-        if start != -1 and end > start:
-            import json
-            parsed = json.loads(content[start:end])
+        parsed = _first_json(r.choices[0].message.content, '{')
+        if isinstance(parsed, dict):
             parsed["url"] = url
             return parsed
     except Exception:
@@ -294,125 +563,284 @@ URL: {url}
     return data
 
 
-def _write_csv(term: str, results: List[Dict]):
-    _ensure_dirs()
-    out_path = os.path.join(DATA_DIR, f"deepscrape_{_sanitize_filename(term)}.csv")
-    # Unified superset of fields; absent ones left blank
-    fieldnames = [
-        'search_term', 'url', 'title', 'author', 'date', 'publisher', 'rank',
-        'excerpt', 'summary', 'has_comments', 'comments', 'scraped_at'
-    ]
-    now = datetime.utcnow().isoformat()
-    new_file = not os.path.exists(out_path)
-    with open(out_path, 'a', newline='', encoding='utf-8') as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
+async def _block_heavy_resources(route):
+    if route.request.resource_type in DETAIL_BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Browser state shared across deepscrape invocations in one process. Playwright
+# objects are bound to the loop that created them, so commands run on _LOOP.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_PW = None
+_CTX = None
+_CTX_LOCK: Optional[asyncio.Lock] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_shutdown)
+    return _LOOP
+
+
+def _forget_ctx(_ctx=None):
+    global _CTX
+    _CTX = None
+
+
+async def _get_ctx():
+    """Launch the persistent Chromium context once and hand it out on later calls."""
+    global _PW, _CTX, _CTX_LOCK
+    if _CTX_LOCK is None:
+        _CTX_LOCK = asyncio.Lock()
+    async with _CTX_LOCK:
+        if _CTX is None:
+            if _PW is None:
+                _PW = await async_playwright().start()
+            _CTX = await _PW.chromium.launch_persistent_context(
+                USER_DATA_DIR,
+                headless=False,
+                args=["--disable-blink-features=AutomationControlled"],
+                viewport={"width": 1280, "height": 900},
+            )
+            # User closed the window or the browser crashed: relaunch next time
+            _CTX.on("close", _forget_ctx)
+        return _CTX
+
+
+async def _close_ctx():
+    global _PW
+    if _CTX is not None:
+        await _CTX.close()
+    _forget_ctx()
+    if _PW is not None:
+        await _PW.stop()
+        _PW = None
+
+
+def _shutdown():
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        _LOOP.run_until_complete(_close_ctx())
+    except Exception:
+        pass
+    _LOOP.close()
+
+
+async def _new_detail_page(ctx):
+    detail = await ctx.new_page()
+    await detail.route("**/*", _block_heavy_resources)
+    return detail
+
+
+async def _process_item(pool: asyncio.Queue, record: Dict, depth: int) -> Dict:
+    """Analyze one result on a pooled tab; the pool size bounds concurrency."""
+    url = record['url']
+    # Separate tabs for per-page analysis so the SERP keeps its position
+    detail = await pool.get()
+    try:
+        print(f"[deepscrape] analyzing depth={depth} -> {url}")
+        detail_data = await _analyze_page_depth(detail, url, depth)
+    finally:
+        pool.put_nowait(detail)
+    print(f"[deepscrape] done depth analysis -> {record['title'][:80]}")
+    record.update(detail_data)
+    # Normalize comments to string for CSV
+    if isinstance(record.get('comments'), list):
+        record['comments'] = json.dumps(record['comments'], ensure_ascii=False)
+    return record
+
+
+# Unified superset of fields; absent ones left blank
+CSV_FIELDNAMES = (
+    'search_term', 'url', 'title', 'author', 'date', 'publisher', 'rank',
+    'excerpt', 'summary', 'has_comments', 'comments', 'scraped_at'
+)
+# Record keys written between search_term and scraped_at, with their defaults
+_CSV_RECORD_COLUMNS = tuple((k, False if k == 'has_comments' else '') for k in CSV_FIELDNAMES[1:-1])
+
+
+class _CsvSink:
+    """Append records to ./data/deepscrape_<term>.csv as soon as they are complete."""
+
+    FLUSH_EVERY = 50
+
+    def __init__(self, term: str):
+        self.term = term
+        self.path = os.path.join(DATA_DIR, f"deepscrape_{_sanitize_filename(term)}.csv")
+        self.count = 0
+        self._f = None
+        self._w = None
+
+    def __enter__(self):
+        _ensure_dirs()
+        new_file = not os.path.exists(self.path)
+        self._f = open(self.path, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        self._w = csv.writer(self._f)
         if new_file:
-            w.writeheader()
-        for r in results:
-            w.writerow({
-                'search_term': term,
-                'url': r.get('url', ''),
-                'title': r.get('title', ''),
-                'author': r.get('author', ''),
-                'date': r.get('date', ''),
-                'publisher': r.get('publisher', ''),
-                'rank': r.get('rank', ''),
-                'excerpt': r.get('excerpt', ''),
-                'summary': r.get('summary', ''),
-                'has_comments': r.get('has_comments', False),
-                'comments': r.get('comments', ''),
-                'scraped_at': now,
-            })
-    return out_path
+            self._w.writerow(CSV_FIELDNAMES)
+        return self
+
+    def write(self, record: Dict):
+        self._w.writerow((
+            self.term,
+            *[record.get(k, default) for k, default in _CSV_RECORD_COLUMNS],
+            datetime.utcnow().isoformat(),
+        ))
+        self.count += 1
+        if self.count % self.FLUSH_EVERY == 0:
+            self._f.flush()
+
+    def __exit__(self, *exc):
+        self._f.close()
+        return False
+
+
+class _RunState:
+    """Bookkeeping shared by the per-engine scrapers of one deepscrape run.
+
+    Scrapers run as tasks on one event loop, so check-then-update sequences
+    with no await in between (URL dedup, slot reservation) need no lock.
+    """
+
+    def __init__(self, term: str, want_results: int, depth: int, deadline: float,
+                 sink: _CsvSink, pool: asyncio.Queue):
+        self.term = term
+        self.want_results = want_results
+        self.depth = depth
+        self.deadline = deadline
+        self.sink = sink
+        self.pool = pool
+        # Results claimed by some engine, written or still in depth analysis
+        self.reserved = 0
+        self.seen_urls: set = set()
+        # Screenshot digests already sent to vision
+        self.seen_hashes: set = set()
+
+    def done(self) -> bool:
+        return self.reserved >= self.want_results or time.time() >= self.deadline
+
+
+async def _scrape_engine(ctx, engine: str, st: _RunState):
+    """Collect results from one engine's SERP in its own tab until the run is done."""
+    page = await ctx.new_page()
+    try:
+        await page.goto(_search_url(engine, st.term), wait_until="domcontentloaded")
+        await asyncio.sleep(2)
+
+        fail_rounds = 0
+        scrolls = 0
+        while not st.done() and fail_rounds < 3 and scrolls < 8:
+            batch = await _extract_search_results(page, engine, st.seen_hashes)
+            pending: List[Dict] = []
+            for item in batch:
+                if st.done():
+                    break
+                url = item.get('url')
+                title = item.get('title', '').strip()
+                if not url or not title:
+                    continue
+                key = _dedup_key(url)
+                if key in st.seen_urls:
+                    continue
+                st.seen_urls.add(key)
+                # Log candidate before filtering
+                try:
+                    rank_log = item.get('rank', '?')
+                    print(f"[deepscrape] candidate rank={rank_log} title={title[:80]} url={url}")
+                except Exception:
+                    pass
+                # Relevance filter (skip if irrelevant)
+                excerpt = item.get('excerpt', '')
+                if not await _is_relevant(st.term, title, excerpt, url):
+                    print(f"[deepscrape] skipped (irrelevant): {title[:80]}")
+                    continue
+                # Another engine may have filled the budget while we awaited
+                if st.done():
+                    break
+                st.reserved += 1
+                pending.append({
+                    'url': url,
+                    'title': title,
+                    'publisher': item.get('publisher', ''),
+                    'excerpt': excerpt,
+                    'rank': item.get('rank', ''),
+                })
+            if st.depth > 0 and pending:
+                # Detail pages are independent; analyze them concurrently
+                results = await asyncio.gather(
+                    *[_process_item(st.pool, record, st.depth) for record in pending],
+                    return_exceptions=True
+                )
+                pending = [
+                    record if isinstance(result, BaseException) else result
+                    for record, result in zip(pending, results)
+                ]
+            for record in pending:
+                st.sink.write(record)
+            if not pending:
+                fail_rounds += 1
+            else:
+                fail_rounds = 0
+            if not st.done() and scrolls < 8:
+                await _scroll_for_more(page, engine)
+                scrolls += 1
+    finally:
+        await page.close()
 
 
 async def _run(term: str, want_results: int, platforms_hint: str, depth: int, timeout_s: int) -> Tuple[str, int]:
-    _ensure_dirs()
     deadline = time.time() + max(1, timeout_s)
     # Plan targets
     plan = await _analyze_platforms_and_plan(term, platforms_hint, depth)
     targets = plan.get('targets', [{'engine': 'duckduckgo'}])
-
-    collected: List[Dict] = []
-
-    async with async_playwright() as p:
-        ctx = await p.chromium.launch_persistent_context(
-            USER_DATA_DIR,
-            headless=False,
-            args=["--disable-blink-features=AutomationControlled"],
-            viewport={"width": 1280, "height": 900},
-        )
-        page = await ctx.new_page()
-
-        for target in targets:
-            if time.time() >= deadline or len(collected) >= want_results:
-                break
-            engine = target.get('engine', 'duckduckgo')
-            url = _search_url(engine, term)
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
-
-            fail_rounds = 0
-            scrolls = 0
-            while len(collected) < want_results and time.time() < deadline and fail_rounds < 3 and scrolls < 8:
-                batch = await _extract_search_results_via_vision(page, engine)
-                new_in_batch = 0
-                for item in batch:
-                    if time.time() >= deadline or len(collected) >= want_results:
-                        break
-                    url = item.get('url')
-                    title = item.get('title', '').strip()
-                    if not url or not title:
-                        continue
-                    # Log candidate before filtering
-                    try:
-                        rank_log = item.get('rank', '?')
-                        print(f"[deepscrape] candidate rank={rank_log} title={title[:80]} url={url}")
-                    except Exception:
-                        pass
-                    # Relevance filter (skip if irrelevant)
-                    excerpt = item.get('excerpt', '')
-                    if not _is_relevant(term, title, excerpt, url):
-                        print(f"[deepscrape] skipped (irrelevant): {title[:80]}")
-                        continue
-                    record = {
-                        'url': url,
-                        'title': title,
-                        'publisher': item.get('publisher', ''),
-                        'excerpt': excerpt,
-                        'rank': item.get('rank', ''),
-                    }
-                    if depth > 0:
-                        # Open a temp tab for per-page analysis to not lose position
-                        detail = await ctx.new_page()
-                        try:
-                            print(f"[deepscrape] analyzing depth={depth} -> {url}")
-                            detail_data = await _analyze_page_depth(detail, url, depth)
-                        finally:
-                            await detail.close()
-                        print(f"[deepscrape] done depth analysis -> {title[:80]}")
-                        record.update(detail_data)
-                        # Normalize comments to string for CSV
-                        if isinstance(record.get('comments'), list):
-                            import json
-                            record['comments'] = json.dumps(record['comments'], ensure_ascii=False)
-                    collected.append(record)
-                    new_in_batch += 1
-                    if len(collected) >= want_results:
-                        break
-                if new_in_batch == 0:
-                    fail_rounds += 1
-                else:
-                    fail_rounds = 0
-                if len(collected) < want_results and time.time() < deadline and scrolls < 8:
-                    await page.evaluate('window.scrollBy(0, document.body.scrollHeight)')
-                    await asyncio.sleep(2)
-                    scrolls += 1
-
-        await ctx.close()
-
-    out_path = _write_csv(term, collected)
-    return out_path, len(collected)
+    # One tab per distinct engine
+    engines = list(dict.fromkeys(t.get('engine', 'duckduckgo').lower() for t in targets))
+
+    with _CsvSink(term) as sink:
+        ctx = await _get_ctx()
+        pool: asyncio.Queue = asyncio.Queue()
+        if depth > 0:
+            # No more tabs than results wanted; each would sit idle with its own route handler
+            tabs = min(DETAIL_CONCURRENCY, want_results)
+            for detail in await asyncio.gather(*[_new_detail_page(ctx) for _ in range(tabs)]):
+                pool.put_nowait(detail)
+        st = _RunState(term, want_results, depth, deadline, sink, pool)
+        try:
+            results = await asyncio.gather(
+                *[_scrape_engine(ctx, engine, st) for engine in engines],
+                return_exceptions=True
+            )
+            for engine, result in zip(engines, results):
+                if isinstance(result, BaseException):
+                    print(f"[deepscrape] {engine} failed: {result}")
+        finally:
+            # Keep the context warm for the next command; only drop this run's tabs
+            while not pool.empty():
+                await pool.get_nowait().close()
+
+    return sink.path, sink.count
+
+
+def _parse_depth(value: str) -> int:
+    d = int(value)
+    if d not in (0, 1, 2, 3):
+        raise ValueError(f"depth must be 0-3, got {d}")
+    return d
+
+
+_ARG_DEFAULTS = {'want_results': 10, 'platforms_hint': '', 'depth': 0, 'timeout_s': 900}
+# flag -> (option name, converter); converters raise ValueError to keep the default
+_ARG_PARSERS = {
+    '--results': ('want_results', lambda v: max(1, int(v))),
+    '--platforms': ('platforms_hint', lambda v: v.strip('"\'')),
+    '--depth': ('depth', _parse_depth),
+    '--timeout': ('timeout_s', lambda v: max(1, int(v))),
+}
 
 
 def deepscrape_command(cli_instance, *args):
@@ -431,31 +859,25 @@ def deepscrape_command(cli_instance, *args):
         return
 
     term = args[0].strip('\"\'')
-    want_results = 10
-    platforms_hint = ""
-    depth = 0
-    timeout_s = 900
-
-    for a in args[1:]:
-        if a.startswith('--results='):
-            try:
-                want_results = max(1, int(a.split('=', 1)[1]))
-            except Exception:
-                pass
-        elif a.startswith('--platforms='):
-            platforms_hint = a.split('=', 1)[1].strip('\"\'')
-        elif a.startswith('--depth='):
-            try:
-                d = int(a.split('=', 1)[1])
-                if d in (0, 1, 2, 3):
-                    depth = d
-            except Exception:
-                pass
-        elif a.startswith('--timeout='):
-            try:
-                timeout_s = max(1, int(a.split('=', 1)[1]))
-            except Exception:
-                pass
+    opts = dict(_ARG_DEFAULTS)
+    rest = iter(args[1:])
+    for a in rest:
+        key, sep, value = a.partition('=')
+        parser = _ARG_PARSERS.get(key)
+        if parser is None:
+            continue
+        if not sep:
+            # Also accept "--results 5"
+            value = next(rest, '')
+        name, fn = parser
+        try:
+            opts[name] = fn(value)
+        except ValueError:
+            pass
+    want_results = opts['want_results']
+    platforms_hint = opts['platforms_hint']
+    depth = opts['depth']
+    timeout_s = opts['timeout_s']
 
     if not term:
         print(f"{Colors.RED}Error: Topic or search term is required{Colors.END}")
@@ -474,7 +896,7 @@ def deepscrape_command(cli_instance, *args):
     print(f"{Colors.WHITE}Timeout (s):{Colors.END} {timeout_s}")
 
     try:
-        out_path, count = asyncio.run(_run(term, want_results, platforms_hint, depth, timeout_s))
+        out_path, count = _get_loop().run_until_complete(_run(term, want_results, platforms_hint, depth, timeout_s))
         print(f"\n{Colors.GREEN}✓ Collected {count}/{want_results} results. CSV: {out_path}{Colors.END}")
     except Exception as e:
         print(f"{Colors.RED}Error: {e}{Colors.END}")
@@ -4,95 +4,211 @@ Shows available OpenAI models and their capabilities
 """
 
 import os
-from openai import OpenAI
+import re
+import sys
+import json
+import time
+import hashlib
+import atexit
+import asyncio
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables (other plugins read their keys from .env through this too)
 load_dotenv()
 
+# .env is only read above, so the key is fixed for the life of the process
+_API_KEY = os.getenv('OPENAI_KEY') or None
+if _API_KEY == 'your_openai_api_key_here':
+    _API_KEY = None
+
+# The model list changes rarely, so it is cached on disk between runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.psyduck', 'cache')
+MODELS_CACHE_PATH = os.path.join(CACHE_DIR, 'models.json')
+MODELS_CACHE_TTL = 3600
+# Case-insensitive category tests without lowercasing a copy of every model id
+_GPT_RE = re.compile(r'gpt', re.IGNORECASE)
+_EMBEDDING_RE = re.compile(r'embedding', re.IGNORECASE)
+# The SDK retries 429s, 5xx and connection errors itself with jittered
+# exponential backoff (0.5s initial, 8s cap); allow three retries per call
+OPENAI_MAX_RETRIES = 3
+# Upper bound on concurrent retrieve calls in model-info-bulk
+BULK_INFO_CONCURRENCY = 20
+
+@lru_cache(maxsize=1)
+def _client_for(api_key):
+    """Build one client per key whose pool keeps TLS sessions alive between commands"""
+    # openai pulls in httpx/pydantic/anyio; import it only once a command needs it
+    import httpx
+    from openai import OpenAI
+    
+    http_client = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    atexit.register(http_client.close)
+    return OpenAI(api_key=api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES)
+
 def get_openai_client():
-    """Initialize OpenAI client with API key from environment"""
-    api_key = os.getenv('OPENAI_KEY')
-    if not api_key or api_key == 'your_openai_api_key_here':
+    """Return the shared OpenAI client, or None if no API key is configured"""
+    return _client_for(_API_KEY) if _API_KEY else None
+
+def _print_missing_key():
+    from psyduck import Colors
+    print(f"\n{Colors.RED}❌ OpenAI API key not configured{Colors.END}\n"
+          f"{Colors.YELLOW}Please set your OPENAI_KEY in the .env file{Colors.END}")
+
+def _require_client():
+    """Return the shared client, or print the missing-key error and return None"""
+    client = get_openai_client()
+    if not client:
+        _print_missing_key()
+    return client
+
+async def _retrieve_many(api_key, names):
+    """Retrieve several models concurrently; failures are returned in place"""
+    import httpx
+    from openai import AsyncOpenAI
+    
+    semaphore = asyncio.Semaphore(BULK_INFO_CONCURRENCY)
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=BULK_INFO_CONCURRENCY,
+                            max_connections=BULK_INFO_CONCURRENCY),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    async with AsyncOpenAI(api_key=api_key, http_client=http_client,
+                           max_retries=OPENAI_MAX_RETRIES) as client:
+        async def retrieve(name):
+            async with semaphore:
+                return await client.models.retrieve(name)
+        return await asyncio.gather(*(retrieve(name) for name in names), return_exceptions=True)
+
+def _model_category(model_id):
+    """0 for GPT models, 1 for embedding models, 2 for everything else"""
+    if _GPT_RE.search(model_id):
+        return 0
+    return 1 if _EMBEDDING_RE.search(model_id) else 2
+
+def _cache_owner(client):
+    """Short fingerprint of the account and endpoint a model list belongs to"""
+    account = f"{client.api_key}\0{client.organization or ''}\0{client.base_url}"
+    return hashlib.blake2b(account.encode('utf-8'), digest_size=8).hexdigest()
+
+def _read_models_cache(owner):
+    """Return (models, etag, mtime) from the disk cache, or None if it is unusable
+
+    A cache written for another key, organization or base URL counts as a miss.
+    """
+    try:
+        mtime = os.path.getmtime(MODELS_CACHE_PATH)
+        with open(MODELS_CACHE_PATH, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('owner') != owner:
+            return None
+        return cached['models'], cached.get('etag'), mtime
+    except (OSError, ValueError, KeyError, TypeError):
         return None
-    return OpenAI(api_key=api_key)
 
-def list_models_command(cli_instance):
+def _write_models_cache(models, etag, owner):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = MODELS_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'owner': owner, 'etag': etag, 'models': models}, f)
+        os.replace(tmp_path, MODELS_CACHE_PATH)
+    except OSError:
+        pass
+
+def _fetch_models(client, ttl=MODELS_CACHE_TTL, refresh=False):
+    """Return model dicts, from the disk cache when it is younger than ttl seconds
+
+    Past the ttl (or with refresh) the list is revalidated with If-None-Match,
+    so an unchanged list costs a 304 with no body instead of a full download.
+    """
+    from openai import APIStatusError
+    
+    owner = _cache_owner(client)
+    cached = _read_models_cache(owner)
+    if cached and not refresh and cached[2] > time.time() - ttl:
+        return cached[0]
+    
+    etag = cached[1] if cached else None
+    try:
+        raw = client.models.with_raw_response.list(
+            extra_headers={'If-None-Match': etag} if etag else None
+        )
+    except APIStatusError as e:
+        if e.status_code != 304:
+            raise
+        # Unchanged upstream: restart the ttl without rewriting the file
+        os.utime(MODELS_CACHE_PATH)
+        return cached[0]
+    
+    models = [model.model_dump() for model in raw.parse().data]
+    _write_models_cache(models, raw.headers.get('etag'), owner)
+    return models
+
+def list_models_command(cli_instance, *args):
     """List all available OpenAI models"""
     from psyduck import Colors
     
-    client = get_openai_client()
+    client = _require_client()
     if not client:
-        print(f"\n{Colors.RED}❌ OpenAI API key not configured{Colors.END}")
-        print(f"{Colors.YELLOW}Please set your OPENAI_KEY in the .env file{Colors.END}")
         return
     
     try:
         print(f"\n{Colors.BOLD}{Colors.CYAN}🤖 Available OpenAI Models{Colors.END}")
         print(f"{Colors.WHITE}{'='*50}{Colors.END}")
         
-        # Get models from OpenAI API
-        models = client.models.list()
+        # Get models from the cache or the OpenAI API
+        models = _fetch_models(client, refresh='--refresh' in args)
         
-        # Categorize models
-        gpt_models = []
-        embedding_models = []
-        other_models = []
+        # One sort by (category, id) yields GPT, embedding, then other models,
+        # each already in order, so every group is emitted in a single pass
+        headers = (
+            f"\n{Colors.GREEN}💬 GPT Models:{Colors.END}",
+            f"\n{Colors.BLUE}🔗 Embedding Models:{Colors.END}",
+            f"\n{Colors.MAGENTA}🔧 Other Models:{Colors.END}",
+        )
+        sorted_ids = sorted((_model_category(model['id']), model['id']) for model in models)
         
-        for model in models.data:
-            model_id = model.id
-            if 'gpt' in model_id.lower():
-                gpt_models.append(model_id)
-            elif 'embedding' in model_id.lower() or 'text-embedding' in model_id.lower():
-                embedding_models.append(model_id)
-            else:
-                other_models.append(model_id)
+        # Build the whole listing and write it at once; only the model id varies per line
+        bullet, end = f"  {Colors.WHITE}• ", Colors.END
+        out = []
+        for category, group in groupby(sorted_ids, key=itemgetter(0)):
+            out.append(headers[category])
+            for _, model in group:
+                out.append(bullet + model + end)
         
-        # Display GPT models
-        if gpt_models:
-            print(f"\n{Colors.GREEN}💬 GPT Models:{Colors.END}")
-            for model in sorted(gpt_models):
-                print(f"  {Colors.WHITE}• {model}{Colors.END}")
-        
-        # Display embedding models
-        if embedding_models:
-            print(f"\n{Colors.BLUE}🔗 Embedding Models:{Colors.END}")
-            for model in sorted(embedding_models):
-                print(f"  {Colors.WHITE}• {model}{Colors.END}")
-        
-        # Display other models
-        if other_models:
-            print(f"\n{Colors.MAGENTA}🔧 Other Models:{Colors.END}")
-            for model in sorted(other_models):
-                print(f"  {Colors.WHITE}• {model}{Colors.END}")
-        
-        print(f"\n{Colors.GREEN}✓ Found {len(models.data)} total models{Colors.END}")
+        out.append(f"\n{Colors.GREEN}✓ Found {len(models)} total models{Colors.END}")
+        sys.stdout.write("\n".join(out) + "\n")
         
     except Exception as e:
         print(f"\n{Colors.RED}❌ Error fetching models: {str(e)}{Colors.END}")
         print(f"{Colors.YELLOW}Please check your API key and internet connection{Colors.END}")
 
-def list_gpt_models_command(cli_instance):
+def list_gpt_models_command(cli_instance, *args):
     """List only GPT models"""
     from psyduck import Colors
     
-    client = get_openai_client()
+    client = _require_client()
     if not client:
-        print(f"\n{Colors.RED}❌ OpenAI API key not configured{Colors.END}")
-        print(f"{Colors.YELLOW}Please set your OPENAI_KEY in the .env file{Colors.END}")
         return
     
     try:
         print(f"\n{Colors.BOLD}{Colors.GREEN}💬 GPT Models Only{Colors.END}")
         print(f"{Colors.WHITE}{'='*30}{Colors.END}")
         
-        models = client.models.list()
-        gpt_models = [model.id for model in models.data if 'gpt' in model.id.lower()]
+        models = _fetch_models(client, refresh='--refresh' in args)
+        gpt_models = [model['id'] for model in models if _GPT_RE.search(model['id'])]
         
         if gpt_models:
-            for model in sorted(gpt_models):
-                print(f"  {Colors.WHITE}• {model}{Colors.END}")
-            print(f"\n{Colors.GREEN}✓ Found {len(gpt_models)} GPT models{Colors.END}")
+            bullet, end = f"  {Colors.WHITE}• ", Colors.END
+            out = [bullet + model + end for model in sorted(gpt_models)]
+            out.append(f"\n{Colors.GREEN}✓ Found {len(gpt_models)} GPT models{Colors.END}")
+            sys.stdout.write("\n".join(out) + "\n")
         else:
             print(f"{Colors.YELLOW}No GPT models found{Colors.END}")
             
@@ -103,6 +219,11 @@ def model_info_command(cli_instance, model_name=None):
     """Get detailed information about a specific model"""
     from psyduck import Colors
     
+    # Create the client first so its connection warms up while the user types
+    client = _require_client()
+    if not client:
+        return
+    
     if not model_name:
         model_name = input(f"{Colors.CYAN}Enter model name: {Colors.END}").strip()
     
@@ -110,12 +231,6 @@ def model_info_command(cli_instance, model_name=None):
         print(f"{Colors.RED}❌ No model name provided{Colors.END}")
         return
     
-    client = get_openai_client()
-    if not client:
-        print(f"\n{Colors.RED}❌ OpenAI API key not configured{Colors.END}")
-        print(f"{Colors.YELLOW}Please set your OPENAI_KEY in the .env file{Colors.END}")
-        return
-    
     try:
         print(f"\n{Colors.BOLD}{Colors.CYAN}🔍 Model Information: {model_name}{Colors.END}")
         print(f"{Colors.WHITE}{'='*50}{Colors.END}")
@@ -130,8 +245,9 @@ def model_info_command(cli_instance, model_name=None):
         
         if hasattr(model, 'permission') and model.permission:
             print(f"{Colors.YELLOW}Permissions:{Colors.END}")
+            bullet, end = f"  {Colors.WHITE}• ", Colors.END
             for perm in model.permission:
-                print(f"  {Colors.WHITE}• {perm.id}{Colors.END}")
+                print(bullet + perm.id + end)
         
         print(f"\n{Colors.GREEN}✓ Model information retrieved{Colors.END}")
         
@@ -139,23 +255,51 @@ def model_info_command(cli_instance, model_name=None):
         print(f"\n{Colors.RED}❌ Error fetching model info: {str(e)}{Colors.END}")
         print(f"{Colors.YELLOW}Model '{model_name}' may not exist or be accessible{Colors.END}")
 
+def model_info_bulk_command(cli_instance, *model_names):
+    """Get information about several models at once"""
+    from psyduck import Colors
+    
+    names = list(dict.fromkeys(name.strip() for name in model_names if name.strip()))
+    if not names:
+        print(f"{Colors.RED}Usage: model-info-bulk <MODEL> [MODEL ...]{Colors.END}")
+        return
+    
+    if not _API_KEY:
+        _print_missing_key()
+        return
+    
+    print(f"\n{Colors.BOLD}{Colors.CYAN}🔍 Model Information ({len(names)} models){Colors.END}")
+    print(f"{Colors.WHITE}{'='*50}{Colors.END}")
+    
+    results = asyncio.run(_retrieve_many(_API_KEY, names))
+    
+    found = 0
+    for name, model in zip(names, results):
+        if isinstance(model, Exception):
+            print(f"\n{Colors.RED}❌ {name}: {str(model)}{Colors.END}")
+            continue
+        found += 1
+        print(f"\n{Colors.YELLOW}Model ID:{Colors.END} {Colors.WHITE}{model.id}{Colors.END}")
+        print(f"{Colors.YELLOW}Object Type:{Colors.END} {Colors.WHITE}{model.object}{Colors.END}")
+        print(f"{Colors.YELLOW}Created:{Colors.END} {Colors.WHITE}{model.created}{Colors.END}")
+        print(f"{Colors.YELLOW}Owned By:{Colors.END} {Colors.WHITE}{model.owned_by}{Colors.END}")
+    
+    print(f"\n{Colors.GREEN}✓ Retrieved {found}/{len(names)} models{Colors.END}")
+
 def test_connection_command(cli_instance):
     """Test OpenAI API connection"""
     from psyduck import Colors
     
-    client = get_openai_client()
+    client = _require_client()
     if not client:
-        print(f"\n{Colors.RED}❌ OpenAI API key not configured{Colors.END}")
-        print(f"{Colors.YELLOW}Please set your OPENAI_KEY in the .env file{Colors.END}")
         return
     
     try:
         print(f"\n{Colors.BOLD}{Colors.CYAN}🔌 Testing OpenAI Connection{Colors.END}")
         print(f"{Colors.WHITE}{'='*35}{Colors.END}")
         
-        # Test with a simple API call
-        models = client.models.list()
-        model_count = len(models.data)
+        # Always hit the API here; refreshing the cache comes for free
+        model_count = len(_fetch_models(client, refresh=True))
         
         print(f"{Colors.GREEN}✓ Connection successful!{Colors.END}")
         print(f"{Colors.WHITE}• API Key: Valid{Colors.END}")
@@ -175,7 +319,12 @@ PLUGIN_INFO = {
         'models': {
             'handler': list_models_command,
             'description': 'List all available OpenAI models',
-            'usage': 'models'
+            'usage': 'models [--refresh]'
+        },
+        'model-info-bulk': {
+            'handler': model_info_bulk_command,
+            'description': 'Show details for several OpenAI models at once',
+            'usage': 'model-info-bulk <MODEL> [MODEL ...]'
         }
     }
 }
@@ -4,18 +4,55 @@ Displays version information and build details
 """
 
 from datetime import datetime
+from functools import lru_cache
 import sys
 import platform
 
+# Nothing here changes while the process runs, so it is computed once at import
+_VERSION_INFO = {
+    'version': '1.0.0',
+    'build_date': '2025-10-28',
+    'python_version': sys.version.split()[0],
+    'platform': platform.system(),
+    'architecture': platform.machine()
+}
+
 def get_version_info():
     """Get comprehensive version information"""
-    return {
-        'version': '1.0.0',
-        'build_date': '2025-10-28',
-        'python_version': sys.version.split()[0],
-        'platform': platform.system(),
-        'architecture': platform.machine()
-    }
+    return _VERSION_INFO
+
+@lru_cache(maxsize=1)
+def _detailed_report():
+    """Return the detailed report split around the current time, the only live field"""
+    from psyduck import Colors
+    
+    info = _VERSION_INFO
+    head = "\n".join([
+        f"\n{Colors.BOLD}{Colors.MAGENTA}🔍 Detailed Version Information{Colors.END}",
+        f"{Colors.WHITE}{'='*50}{Colors.END}",
+        
+        # Basic info
+        f"{Colors.CYAN}Application:{Colors.END}",
+        f"  {Colors.WHITE}Name:{Colors.END} Psyduck CLI",
+        f"  {Colors.WHITE}Version:{Colors.END} {info['version']}",
+        f"  {Colors.WHITE}Build Date:{Colors.END} {info['build_date']}",
+        
+        # System info
+        f"\n{Colors.CYAN}System:{Colors.END}",
+        f"  {Colors.WHITE}Platform:{Colors.END} {info['platform']}",
+        f"  {Colors.WHITE}Architecture:{Colors.END} {info['architecture']}",
+        f"  {Colors.WHITE}Python Version:{Colors.END} {info['python_version']}",
+        
+        # Runtime info
+        f"\n{Colors.CYAN}Runtime:{Colors.END}",
+        f"  {Colors.WHITE}Current Time:{Colors.END} ",
+    ])
+    tail = "\n".join([
+        "",
+        f"  {Colors.WHITE}Python Executable:{Colors.END} {sys.executable}",
+        f"\n{Colors.GREEN}✓ Detailed version information displayed{Colors.END}\n",
+    ])
+    return head, tail
 
 def version_command(cli_instance):
     """Version command handler"""
@@ -36,31 +73,8 @@ def version_command(cli_instance):
 
 def version_detailed_command(cli_instance):
     """Detailed version command with more info"""
-    from psyduck import Colors
-    
-    info = get_version_info()
-    
-    print(f"\n{Colors.BOLD}{Colors.MAGENTA}🔍 Detailed Version Information{Colors.END}")
-    print(f"{Colors.WHITE}{'='*50}{Colors.END}")
-    
-    # Basic info
-    print(f"{Colors.CYAN}Application:{Colors.END}")
-    print(f"  {Colors.WHITE}Name:{Colors.END} Psyduck CLI")
-    print(f"  {Colors.WHITE}Version:{Colors.END} {info['version']}")
-    print(f"  {Colors.WHITE}Build Date:{Colors.END} {info['build_date']}")
-    
-    # System info
-    print(f"\n{Colors.CYAN}System:{Colors.END}")
-    print(f"  {Colors.WHITE}Platform:{Colors.END} {info['platform']}")
-    print(f"  {Colors.WHITE}Architecture:{Colors.END} {info['architecture']}")
-    print(f"  {Colors.WHITE}Python Version:{Colors.END} {info['python_version']}")
-    
-    # Runtime info
-    print(f"\n{Colors.CYAN}Runtime:{Colors.END}")
-    print(f"  {Colors.WHITE}Current Time:{Colors.END} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"  {Colors.WHITE}Python Executable:{Colors.END} {sys.executable}")
-    
-    print(f"\n{Colors.GREEN}✓ Detailed version information displayed{Colors.END}")
+    head, tail = _detailed_report()
+    sys.stdout.write(head + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + tail)
 
 # Plugin metadata
 PLUGIN_INFO = {
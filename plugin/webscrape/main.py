@@ -3,246 +3,642 @@ Webscrape plugin for Psyduck CLI
 Scrapes search results from DuckDuckGo, Google, or Bing using vision AI
 
 Command:
-  webscrape "<SEARCH TERM>" <LIMIT> --location=<duckduckgo|google|bing>
+  webscrape "<SEARCH TERM>" <LIMIT> --location=<duckduckgo|google|bing> [--batch]
 
 Behavior:
-  - Launches Chromium with a persistent profile
+  - Reuses one Chromium across runs, with a fresh incognito context per scrape
   - Navigates to selected search engine
-  - Uses OpenAI Vision to analyze search results
+  - Reads result cards from the page DOM when the layout is recognized,
+    falling back to OpenAI Vision on screenshots otherwise
   - Extracts headlines, links, excerpts, publisher names, dates
+  - With --batch, captures every frame first and analyzes them in one
+    OpenAI Batch API job (half price, not real time)
   - Saves results to CSV in ./data/webscrape_<engine>_<term>.csv
 """
 
 import os
 import csv
+import atexit
 import asyncio
 import random
-import base64
+import binascii
+import hashlib
 import io
 import re
+import time
 import argparse
-from datetime import datetime
+from collections import OrderedDict, deque
+from operator import itemgetter
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import quote_plus, urlsplit
 from typing import List, Dict, Optional, Tuple
 import json
+import importlib.util
 
-try:
+# Playwright, OpenAI and Pillow are only imported when a scrape runs
+# (_import_dependencies); loading the plugin just checks they are installed
+_MISSING_DEPENDENCIES = [name for name in ('playwright', 'openai', 'PIL')
+                         if importlib.util.find_spec(name) is None]
+DEPENDENCIES_AVAILABLE = not _MISSING_DEPENDENCIES
+if not DEPENDENCIES_AVAILABLE:
+    print(f"Warning: Webscrape plugin dependencies not available: {', '.join(_MISSING_DEPENDENCIES)}")
+
+async_playwright = PlaywrightTimeoutError = AsyncOpenAI = RateLimitError = Image = None
+
+
+def _import_dependencies():
+    global async_playwright, PlaywrightTimeoutError, AsyncOpenAI, RateLimitError, Image
+    if Image is not None:
+        return
     from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-    from openai import OpenAI
+    from openai import AsyncOpenAI, RateLimitError
     from PIL import Image
-    DEPENDENCIES_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Webscrape plugin dependencies not available: {e}")
-    DEPENDENCIES_AVAILABLE = False
 
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-USER_DATA_DIR = os.path.join(DATA_DIR, 'webscrape_user')
+
+# A tall, wide viewport lays out more results per screenshot, so fewer
+# rounds (and vision calls) are needed for a given limit
+VIEWPORT = {"width": 1920, "height": 1400}
+# Vision only needs legible text, so screenshots are lossy JPEG
+SCREENSHOT_QUALITY = 75
+# click() already waits for visibility; a short timeout skips hidden matches quickly
+CLICK_TIMEOUT_MS = 1000
+# Matches tried per locator before giving up on it
+CLICK_MAX_CANDIDATES = 5
+# Vision reads a screenshot of the results, so images and stylesheets stay;
+# video/audio and web fonts are never needed to read the results
+BLOCKED_RESOURCES = frozenset({'media', 'font'})
+# Ad and tracking hosts: their frames and pixels only slow loading and
+# add noise to the screenshots
+BLOCKED_HOSTS = ('doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+                 'google-analytics.com', 'googletagmanager.com', 'bat.bing.com')
+# Wait for the page to go quiet after a click or scroll instead of a fixed sleep
+SETTLE_TIMEOUT_MS = 2000
+# How long a freshly opened results page may take to show its results
+RESULTS_TIMEOUT_MS = 10000
+# Vision calls rejected with 429 are retried with exponential backoff, at most
+# three attempts in all; the SDK's own retries are off for these calls
+VISION_MAX_RETRIES = 2
+VISION_BACKOFF_BASE = 2.0
+# Upper bound on load-more/pagination/scroll rounds per run
+MAX_SCROLLS = 10
+# After this many load-more rounds, the next pagination click that lands on a new
+# URL reopens that URL in a fresh page; Chromium only frees a page's heap when
+# the page closes
+PAGE_RECYCLE_EVERY = 5
+# Rough number of results one screenshot yields; bounds how many frames are worth capturing
+RESULTS_PER_FRAME = 5
+# Vision calls in flight while the page keeps loading, and the account limits they are paced to
+VISION_WORKERS = 5
+VISION_RPM = 500
+VISION_TPM = 200_000
+# Screenshots sent together in one multi-image vision request
+VISION_FRAMES_PER_CALL = 4
+# Token estimate per analyzed screenshot (image + prompt + completion budget) for TPM pacing
+VISION_TOKENS_PER_CALL = 4000
+# Batch API polling backoff
+BATCH_POLL_INITIAL = 5.0
+BATCH_POLL_MAX = 60.0
+# Screenshots wider than this are scaled down before upload (aspect ratio kept)
+SCREENSHOT_MAX_WIDTH = 1024
+
+# Recent vision results keyed by (engine, search term, perceptual hash); frames
+# of the same search within VISION_CACHE_MAX_DISTANCE bits of a cached one reuse
+# its results. The hash mostly encodes layout, so it is never shared across searches
+VISION_CACHE_SIZE = 64
+VISION_CACHE_MAX_DISTANCE = 4
+# Mean grayscale intensity outside this range means a blank (still loading)
+# or black (error) frame that is not worth a vision call
+BLANK_FRAME_MIN_MEAN = 5
+BLANK_FRAME_MAX_MEAN = 250
+_vision_cache: "OrderedDict[Tuple[str, str, int], List[Dict]]" = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _openai_client_for(api_key: str):
+    # Async client: its pool lives on _LOOP, which every command runs on
+    return AsyncOpenAI(api_key=api_key)
 
 
 def get_openai_client():
+    """Return a shared client so vision calls reuse one connection pool."""
     if not DEPENDENCIES_AVAILABLE:
         return None
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         return None
-    return OpenAI(api_key=api_key)
+    return _openai_client_for(api_key)
+
+
+_BLOCKED_HOST_RE = re.compile(r'(?:^|\.)(?:' + '|'.join(map(re.escape, BLOCKED_HOSTS)) + r')$')
+
+
+async def _block_heavy_resources(route):
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCES
+            or _BLOCKED_HOST_RE.search(urlsplit(request.url).hostname or '')):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _settle(page):
+    """Give newly requested content a moment to load; never raises."""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=SETTLE_TIMEOUT_MS)
+    except Exception:
+        pass
+
+
+async def _create_completion(client, **kwargs):
+    """Run a chat completion, backing off only on 429s."""
+    # The backoff below is the only retry layer; stacked on the SDK's it would
+    # resend one rate-limited call many times
+    client = client.with_options(max_retries=0)
+    for attempt in range(VISION_MAX_RETRIES + 1):
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except RateLimitError:
+            if attempt == VISION_MAX_RETRIES:
+                raise
+            delay = VISION_BACKOFF_BASE ** attempt + random.uniform(0, 1)
+            print(f"[webscrape] Rate limited by OpenAI, retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
 
 
 def _ensure_dirs():
     os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(USER_DATA_DIR, exist_ok=True)
+
+
+_UNSAFE_RE = re.compile(r'[^\w\s-]')
+_COLLAPSE_RE = re.compile(r'[-\s]+')
 
 
 def _sanitize_filename(text: str) -> str:
     """Sanitize text for use in filename"""
     # Remove special characters and replace spaces with underscores
-    sanitized = re.sub(r'[^\w\s-]', '', text)
-    sanitized = re.sub(r'[-\s]+', '_', sanitized)
+    sanitized = _UNSAFE_RE.sub('', text)
+    sanitized = _COLLAPSE_RE.sub('_', sanitized)
     return sanitized[:50]  # Limit length
 
 
+SEARCH_URL_TEMPLATES = {
+    'duckduckgo': "https://duckduckgo.com/?q={q}&t=h_&ia=web",
+    'google': "https://www.google.com/search?q={q}&tbm=nws",
+    'bing': "https://www.bing.com/news/search?q={q}",
+}
+
+
 def _get_search_url(search_term: str, engine: str) -> str:
     """Generate search URL for the specified engine"""
-    encoded_term = search_term.replace(' ', '+')
-    
-    if engine.lower() == 'duckduckgo':
-        return f"https://duckduckgo.com/?q={encoded_term}&t=h_&ia=web"
-    elif engine.lower() == 'google':
-        return f"https://www.google.com/search?q={encoded_term}&tbm=nws"
-    elif engine.lower() == 'bing':
-        return f"https://www.bing.com/news/search?q={encoded_term}"
-    else:
-        raise ValueError(f"Unsupported search engine: {engine}")
+    try:
+        template = SEARCH_URL_TEMPLATES[engine.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported search engine: {engine}") from None
+    # quote_plus also escapes &, #, ? and / that would otherwise break the query
+    return template.format(q=quote_plus(search_term))
+
+
+# Results containers per engine, in priority order
+RESULTS_SELECTORS = {
+    'google': (
+        '#search',  # Main search container
+        '#rso',  # Results container
+        '#main',  # Main content
+        '[data-async-context]',  # Async results container
+    ),
+    'bing': (
+        '#b_results',  # Bing results
+        '#b_content',  # Bing content
+        '.b_results',  # Alternative class
+        'main',  # Main element
+    ),
+    'duckduckgo': (
+        '#links',  # Main links container
+        '.results',  # Results class
+        '#web_content_wrapper',  # Content wrapper
+        'main',  # Main element
+    ),
+}
+
+# Result cards per engine for reading results straight from the DOM. Fields
+# that do not match are left empty; a card without a title is dropped.
+DOM_RESULT_FIELDS = {
+    'google': {
+        'card': 'div.SoaBEf',
+        'title': 'div[role="heading"]',
+        'link': 'a[href]',
+        'excerpt': '.GI74Re',
+        'publisher': '.MgUUmf',
+        'date': '.OSrXXb',
+    },
+    'bing': {
+        'card': 'div.news-card',
+        'title': 'a.title',
+        'link': 'a.title',
+        'excerpt': '.snippet',
+        'publisher': '.source a',
+        'date': '.source span[aria-label]',
+    },
+    'duckduckgo': {
+        'card': 'article[data-testid="result"]',
+        'title': 'a[data-testid="result-title-a"]',
+        'link': 'a[data-testid="result-title-a"]',
+        'excerpt': '[data-result="snippet"]',
+        'publisher': '[data-testid="result-extras-url-link"]',
+        'date': '',
+    },
+}
+
+# A freshly opened page is ready once a result card or the engine's primary
+# results container shows; the broader fallback containers (e.g. main) are on
+# screen before any results are
+_RESULTS_READY_SELECTORS = {
+    engine: f"{fields['card']}, {RESULTS_SELECTORS[engine][0]}"
+    for engine, fields in DOM_RESULT_FIELDS.items()
+}
+
+_DOM_RESULTS_SCRIPT = """(fields) => Array.from(document.querySelectorAll(fields.card), (card, i) => {
+    const text = (sel) => {
+        const el = sel && card.querySelector(sel);
+        return el ? el.innerText.trim() : '';
+    };
+    const link = card.querySelector(fields.link);
+    return {
+        title: text(fields.title),
+        url: link ? link.href : '',
+        excerpt: text(fields.excerpt),
+        publisher: text(fields.publisher),
+        date: text(fields.date),
+        rank: i + 1,
+    };
+})"""
+
+LOAD_MORE_TEXTS = ("Load more", "Show more", "More results", "Load additional results")
+LOAD_MORE_SELECTORS = (
+    'button[data-testid="load-more"]',
+    'button[aria-label*="Load more"]',
+    'button[aria-label*="Show more"]',
+    'a[href*="more"]',
+    'a#pnnext',
+    'a[aria-label*="More"]',
+    'a[title*="Next"]',
+)
+
+PAGINATION_TEXTS = ("Next", "Next page", "→", "›")
+_GENERIC_PAGINATION_SELECTORS = (
+    'a[aria-label*="Next"]',
+    'button[aria-label*="Next"]',
+    'a.pagination__next',
+    'a.next',
+    'nav a:last-child',
+)
+# Engine-specific "next page" selectors first, then generic patterns
+PAGINATION_SELECTORS = {
+    'google': (
+        'a#pnnext',
+        'a[aria-label="Next"]',
+        'a[aria-label*="Next page"]',
+        'td[style*="text-align:left"] a',
+    ) + _GENERIC_PAGINATION_SELECTORS,
+    'bing': (
+        'a[title="Next page"]',
+        'a[aria-label="Next"]',
+        'a.sb_pagN',
+        'a[href*="first="]',
+    ) + _GENERIC_PAGINATION_SELECTORS,
+    'duckduckgo': (
+        'a.result--more__btn',
+        'a[href*="next"]',
+    ) + _GENERIC_PAGINATION_SELECTORS,
+}
+
+
+# Each list as one query: a case-insensitive text regex, or a comma-joined CSS
+# selector list (matches come back in document order)
+_LOAD_MORE_TEXT_RE = re.compile("|".join(map(re.escape, LOAD_MORE_TEXTS)), re.IGNORECASE)
+_LOAD_MORE_CSS = ", ".join(LOAD_MORE_SELECTORS)
+# Pagination text must be the control's whole label, so result links whose
+# titles or breadcrumbs merely contain "next" or "›" are not clicked
+_PAGINATION_TEXT_RE = re.compile(r"^\s*(?:%s)\s*$" % "|".join(map(re.escape, PAGINATION_TEXTS)), re.IGNORECASE)
+_PAGINATION_CSS = {engine: ", ".join(selectors) for engine, selectors in PAGINATION_SELECTORS.items()}
+
+
+# Index of the first selector matching a visible element with children, or -1
+_FIRST_CONTAINER_SCRIPT = """(selectors) => selectors.findIndex((sel) => {
+    const el = document.querySelector(sel);
+    if (!el || el.children.length === 0) return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+})"""
 
 
 async def _find_results_container(page, engine: str):
     """Find the search results container element for the given engine"""
     try:
-        # Engine-specific selectors for results containers
-        if engine.lower() == 'google':
-            selectors = [
-                '#search',  # Main search container
-                '#rso',  # Results container
-                '#main',  # Main content
-                '[data-async-context]',  # Async results container
-            ]
-        elif engine.lower() == 'bing':
-            selectors = [
-                '#b_results',  # Bing results
-                '#b_content',  # Bing content
-                '.b_results',  # Alternative class
-                'main',  # Main element
-            ]
-        else:  # DuckDuckGo
-            selectors = [
-                '#links',  # Main links container
-                '.results',  # Results class
-                '#web_content_wrapper',  # Content wrapper
-                'main',  # Main element
-            ]
+        selectors = RESULTS_SELECTORS.get(engine.lower(), RESULTS_SELECTORS['duckduckgo'])
         
-        # Try each selector
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    is_visible = await element.is_visible()
-                    if is_visible:
-                        # Verify it has some content (has child elements)
-                        child_count = await element.evaluate('el => el.children.length')
-                        if child_count > 0:
-                            print(f"[webscrape] Found results container: {selector}")
-                            return element
-            except Exception:
-                continue
-        
-        return None
+        # Pick the first visible, non-empty match in priority order inside the page,
+        # instead of a query/visibility/child-count round trip per selector
+        index = await page.evaluate(_FIRST_CONTAINER_SCRIPT, list(selectors))
+        if index < 0:
+            return None
+        selector = selectors[index]
+        element = await page.query_selector(selector)
+        if element:
+            print(f"[webscrape] Found results container: {selector}")
+        return element
     except Exception as e:
         print(f"[webscrape] Error finding results container: {e}")
         return None
 
 
+async def _extract_dom_results(page, engine: str) -> List[Dict]:
+    """Read result cards straight from the DOM; empty if the layout is not recognized"""
+    fields = DOM_RESULT_FIELDS.get(engine.lower())
+    if not fields:
+        return []
+    try:
+        results = await page.evaluate(_DOM_RESULTS_SCRIPT, fields)
+    except Exception as e:
+        print(f"[webscrape] DOM extraction failed: {e}")
+        return []
+    return [r for r in results if r['title']]
+
+
 async def _take_screenshot(page, engine: str = None, element=None) -> bytes:
     """Take screenshot of page or specific element, preferring results container"""
     if element:
-        return await element.screenshot()
+        return await element.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY)
     
     # Try to find and screenshot just the results container
     if engine:
         container = await _find_results_container(page, engine)
         if container:
             try:
-                return await container.screenshot()
+                return await container.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY)
             except Exception as e:
                 print(f"[webscrape] Container screenshot failed, using full page: {e}")
     
-    # Fallback to full page screenshot
-    return await page.screenshot()
+    # Fallback to viewport screenshot
+    return await page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY, full_page=False)
+
+
+def _downscale_image(image_bytes: bytes, max_width: int = SCREENSHOT_MAX_WIDTH) -> bytes:
+    """Shrink a screenshot to max_width to cut upload size and image tokens"""
+    img = Image.open(io.BytesIO(image_bytes))
+    if img.width <= max_width:
+        return image_bytes
+    img = img.resize((max_width, round(img.height * max_width / img.width)), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    img.convert("RGB").save(buf, "JPEG", quality=SCREENSHOT_QUALITY, optimize=True)
+    return buf.getvalue()
+
+
+def _perceptual_hash(image_bytes: bytes) -> int:
+    """256-bit difference hash (16x16) that tolerates JPEG noise and tiny shifts"""
+    img = Image.open(io.BytesIO(image_bytes)).convert("L").resize((17, 16), Image.Resampling.BILINEAR)
+    px = img.tobytes()
+    bits = 0
+    for row in range(0, 17 * 16, 17):
+        for col in range(row, row + 16):
+            bits = (bits << 1) | (px[col] > px[col + 1])
+    return bits
+
+
+def _is_blank_frame(image_bytes: bytes) -> bool:
+    """True if a screenshot is almost uniformly white or black"""
+    px = Image.open(io.BytesIO(image_bytes)).convert("L").resize((64, 64)).tobytes()
+    mean = sum(px) / len(px)
+    return mean > BLANK_FRAME_MAX_MEAN or mean < BLANK_FRAME_MIN_MEAN
+
+
+def _same_frame(a: int, b: int) -> bool:
+    """True if two perceptual hashes are close enough to be the same frame"""
+    return bin(a ^ b).count("1") <= VISION_CACHE_MAX_DISTANCE
+
+
+def _lookup_vision_cache(engine: str, search_term: str, phash: int) -> Optional[List[Dict]]:
+    """Return cached results for a near-identical frame of the same search, if any"""
+    for key, results in _vision_cache.items():
+        if key[:2] == (engine, search_term) and _same_frame(key[2], phash):
+            _vision_cache.move_to_end(key)
+            return results
+    return None
+
+
+def _store_vision_cache(engine: str, search_term: str, phash: int, results: List[Dict]):
+    key = (engine, search_term, phash)
+    _vision_cache[key] = results
+    _vision_cache.move_to_end(key)
+    while len(_vision_cache) > VISION_CACHE_SIZE:
+        _vision_cache.popitem(last=False)
 
 
 def _encode_image(image_bytes: bytes) -> str:
     """Encode image bytes to base64 for OpenAI API"""
-    return base64.b64encode(image_bytes).decode('utf-8')
+    return binascii.b2a_base64(image_bytes, newline=False).decode('ascii')
 
 
-async def _analyze_search_results(page, engine: str) -> Tuple[List[Dict], int, float]:
-    """Use OpenAI Vision to analyze search results"""
-    screenshot = await _take_screenshot(page, engine)
-    base64_image = _encode_image(screenshot)
-    
-    client = get_openai_client()
-    if not client:
-        print("OpenAI client not available")
-        return [], 0, 0.0
-    
-    # Different prompts for different search engines
-    if engine.lower() == 'duckduckgo':
-        prompt = """Analyze this DuckDuckGo search results page. Extract all visible search results and return a JSON array with this structure:
+def _decode_json(content: Optional[str]):
+    """Decode a structured-output vision reply; None if empty (e.g. a refusal)"""
+    if not content:
+        return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
 
-[
-  {
+def _result_list(data) -> List[Dict]:
+    return [r for r in data if isinstance(r, dict)] if isinstance(data, list) else []
+
+
+def _parse_results(content: Optional[str]) -> List[Dict]:
+    """Pull the results list out of a {"results": [...]} vision reply"""
+    data = _decode_json(content)
+    if isinstance(data, dict):
+        data = data.get('results', [])
+    return _result_list(data)
+
+
+def _parse_pages(content: Optional[str], count: int) -> List[List[Dict]]:
+    """Split a multi-screenshot reply ({"pages": [[...], ...]}) into one list per screenshot"""
+    if count == 1:
+        return [_parse_results(content)]
+    data = _decode_json(content)
+    pages = data.get('pages') if isinstance(data, dict) else None
+    pages = [_result_list(page) for page in pages[:count]] if isinstance(pages, list) else []
+    return pages + [[] for _ in range(count - len(pages))]
+
+
+ENGINE_NAMES = {'duckduckgo': 'DuckDuckGo', 'google': 'Google', 'bing': 'Bing'}
+
+VISION_MODEL = "gpt-4o-mini"
+_RESULT_EXAMPLE = """  {
     "title": "article headline",
     "url": "full URL if visible",
     "excerpt": "description/snippet text",
     "publisher": "publisher name if visible",
     "date": "publication date if visible",
     "rank": 1
-  }
-]
-
-Focus on:
+  }"""
+_VISION_GUIDELINES = """Focus on:
 - Main search results (not ads or related searches)
 - Extract full headlines and descriptions
 - Include URLs when visible
 - Note publisher names and dates
-- Number results by rank (1, 2, 3, etc.)
-- Return only the JSON array, no other text"""
-    
-    elif engine.lower() == 'google':
-        prompt = """Analyze this Google search results page. Extract all visible search results and return a JSON array with this structure:
+- Number results by rank (1, 2, 3, etc.)"""
 
-[
-  {
-    "title": "article headline",
-    "url": "full URL if visible", 
-    "excerpt": "description/snippet text",
-    "publisher": "publisher name if visible",
-    "date": "publication date if visible",
-    "rank": 1
-  }
-]
+# Structured outputs make the model return exactly these shapes, so no prose
+# is generated and replies parse with a plain json.loads
+_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "url": {"type": "string"},
+        "excerpt": {"type": "string"},
+        "publisher": {"type": "string"},
+        "date": {"type": "string"},
+        "rank": {"type": "integer"},
+    },
+    "required": ["title", "url", "excerpt", "publisher", "date", "rank"],
+    "additionalProperties": False,
+}
+_RESULTS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "search_results",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"results": {"type": "array", "items": _RESULT_SCHEMA}},
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+_PAGES_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "search_result_pages",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "pages": {"type": "array", "items": {"type": "array", "items": _RESULT_SCHEMA}},
+            },
+            "required": ["pages"],
+            "additionalProperties": False,
+        },
+    },
+}
 
-Focus on:
-- Main search results (not ads or related searches)
-- Extract full headlines and descriptions
-- Include URLs when visible
-- Note publisher names and dates
-- Number results by rank (1, 2, 3, etc.)
-- Return only the JSON array, no other text"""
-    
-    else:  # Bing
-        prompt = """Analyze this Bing search results page. Extract all visible search results and return a JSON array with this structure:
 
-[
-  {
-    "title": "article headline",
-    "url": "full URL if visible",
-    "excerpt": "description/snippet text", 
-    "publisher": "publisher name if visible",
-    "date": "publication date if visible",
-    "rank": 1
-  }
-]
+@lru_cache(maxsize=None)
+def _vision_prompt(engine: str, count: int = 1) -> str:
+    name = ENGINE_NAMES.get(engine.lower(), engine)
+    if count == 1:
+        return (f"Analyze this {name} search results page. Extract all visible search results "
+                "and return a JSON object with this structure:\n\n"
+                '{"results": [\n' + _RESULT_EXAMPLE + '\n]}\n\n' + _VISION_GUIDELINES)
+    example = "\n".join("  " + line for line in _RESULT_EXAMPLE.splitlines())
+    return (f"You will receive {count} screenshots of {name} search results pages, in order. "
+            "Extract all visible search results from each screenshot and return a JSON object "
+            "with one list per screenshot, in the same order:\n\n"
+            '{"pages": [\n  [\n' + example + '\n  ]\n]}\n\n' + _VISION_GUIDELINES)
 
-Focus on:
-- Main search results (not ads or related searches)
-- Extract full headlines and descriptions
-- Include URLs when visible
-- Note publisher names and dates
-- Number results by rank (1, 2, 3, etc.)
-- Return only the JSON array, no other text"""
+
+def _vision_request(engine: str, base64_images: List[str]) -> Dict:
+    """Chat completion arguments for analyzing one or more screenshots in one call"""
+    content = [{"type": "text", "text": _vision_prompt(engine, len(base64_images))}]
+    content += [
+        {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{b64}"}}
+        for b64 in base64_images
+    ]
+    return {
+        "model": VISION_MODEL,
+        "messages": [{"role": "user", "content": content}],
+        "max_tokens": min(3000 * len(base64_images), 16000),
+        "response_format": _RESULTS_FORMAT if len(base64_images) == 1 else _PAGES_FORMAT,
+    }
+
+
+class _RateLimiter:
+    """Requests- and tokens-per-minute buckets refilled on a monotonic clock"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed, self._last = now - self._last, now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep(max((1 - self._requests) * 60 / self.rpm,
+                                        (tokens - self._tokens) * 60 / self.tpm))
+
+
+async def _capture_frame(page, engine: str, container=None):
+    """Screenshot the results and shrink it for upload
+
+    container is the results element resolved on an earlier call. It is reused
+    until a screenshot through it fails (typically a detached handle after
+    navigation), then resolved again. Returns (frame, container for next call).
+    """
+    if container is not None:
+        try:
+            return _downscale_image(await _take_screenshot(page, element=container)), container
+        except Exception:
+            pass
+    container = await _find_results_container(page, engine)
+    if container is not None:
+        try:
+            return _downscale_image(await _take_screenshot(page, element=container)), container
+        except Exception as e:
+            print(f"[webscrape] Container screenshot failed, using full page: {e}")
+    return _downscale_image(await _take_screenshot(page)), None
+
+
+async def _analyze_frames(frames: List[Tuple[bytes, int]], engine: str,
+                          search_term: str) -> Tuple[List[List[Dict]], int, float]:
+    """Use OpenAI Vision to analyze captured (screenshot, phash) frames in one request
+
+    Returns one results list per frame, in order. Frames matching a cached
+    analysis of the same search are answered from the cache and left out of
+    the request.
+    """
+    pages: List[Optional[List[Dict]]] = [_lookup_vision_cache(engine, search_term, phash) for _, phash in frames]
+    todo = [i for i, page in enumerate(pages) if page is None]
+    if len(todo) < len(frames):
+        print(f"[webscrape] {len(frames) - len(todo)} screenshot(s) match previously analyzed frames, reusing results")
+    if not todo:
+        return pages, 0, 0.0
+    
+    client = get_openai_client()
+    if not client:
+        print("OpenAI client not available")
+        return [page or [] for page in pages], 0, 0.0
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
-                            }
-                        }
-                    ]
-                }
-            ],
-            max_tokens=3000
+        response = await _create_completion(
+            client, **_vision_request(engine, [_encode_image(frames[i][0]) for i in todo])
         )
         
         # Track token usage (real values from OpenAI API)
@@ -261,62 +657,42 @@ Focus on:
         print(f"[webscrape] Token usage (from API) - Prompt: {prompt_tokens:,}, Completion: {completion_tokens:,}, Total: {tokens_used:,}")
         print(f"[webscrape] Cost breakdown - Input: ${input_cost:.6f}, Output: ${output_cost:.6f}, Total: ${cost:.6f}")
         
-        content = response.choices[0].message.content
-        # Extract JSON from response
-        start = content.find('[')
-        end = content.rfind(']') + 1
-        if start != -1 and end > start:
-            json_str = content[start:end]
-            results = json.loads(json_str)
-            return results, tokens_used, cost
-        return [], tokens_used, cost
+        analyzed = _parse_pages(response.choices[0].message.content, len(todo))
+        for i, results in zip(todo, analyzed):
+            pages[i] = results
+            if results:
+                _store_vision_cache(engine, search_term, frames[i][1], results)
+        return pages, tokens_used, cost
         
     except Exception as e:
         print(f"Vision analysis error: {e}")
-        return [], 0, 0.0
+        return [page or [] for page in pages], 0, 0.0
+
+
+async def _click_first(locator, label: str) -> bool:
+    """Click the first of locator's matches that accepts a click"""
+    for i in range(min(await locator.count(), CLICK_MAX_CANDIDATES)):
+        try:
+            await locator.nth(i).click(timeout=CLICK_TIMEOUT_MS)
+            print(f"[webscrape] Clicked {label}")
+            return True
+        except Exception:
+            continue
+    return False
 
 
 async def _try_click_load_more(page, engine: str) -> bool:
     """Try to find and click 'Load more' or 'Show more' buttons"""
     try:
-        # Try text-based locators first (more reliable)
-        text_patterns = ["Load more", "Show more", "More results", "Load additional results"]
-        for text in text_patterns:
-            try:
-                locator = page.get_by_text(text, exact=False)
-                if await locator.count() > 0:
-                    first = locator.first
-                    if await first.is_visible():
-                        print(f"[webscrape] Found load more button: '{text}'")
-                        await first.click(timeout=5000)
-                        await asyncio.sleep(random.uniform(2, 4))
-                        return True
-            except Exception:
-                continue
+        # Try text-based locators first (more reliable); one regex covers every phrase
+        if await _click_first(page.get_by_text(_LOAD_MORE_TEXT_RE), "load more button"):
+            await _settle(page)
+            return True
         
-        # Try CSS selectors as fallback
-        selectors = [
-            'button[data-testid="load-more"]',
-            'button[aria-label*="Load more"]',
-            'button[aria-label*="Show more"]',
-            'a[href*="more"]',
-            'a#pnnext',
-            'a[aria-label*="More"]',
-            'a[title*="Next"]',
-        ]
-        
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    is_visible = await element.is_visible()
-                    if is_visible:
-                        print(f"[webscrape] Found load more button: {selector}")
-                        await element.click(timeout=5000)
-                        await asyncio.sleep(random.uniform(2, 4))
-                        return True
-            except Exception:
-                continue
+        # Try CSS selectors as fallback, OR-ed into a single query
+        if await _click_first(page.locator(_LOAD_MORE_CSS), "load more button"):
+            await _settle(page)
+            return True
         
         return False
     except Exception as e:
@@ -327,72 +703,18 @@ async def _try_click_load_more(page, engine: str) -> bool:
 async def _try_click_pagination(page, engine: str) -> bool:
     """Try to find and click pagination 'Next' button"""
     try:
-        # Try text-based locators first (more reliable)
-        text_patterns = ["Next", "Next page", "→", "›"]
-        for text in text_patterns:
-            try:
-                locator = page.get_by_text(text, exact=False)
-                if await locator.count() > 0:
-                    # Filter to find the actual pagination next button
-                    # Usually it's in a navigation area or has specific attributes
-                    for i in range(await locator.count()):
-                        try:
-                            elem = locator.nth(i)
-                            if await elem.is_visible():
-                                # Check if it's likely a pagination button (has href or is in nav)
-                                tag_name = await elem.evaluate('el => el.tagName.toLowerCase()')
-                                if tag_name in ['a', 'button']:
-                                    print(f"[webscrape] Found pagination button: '{text}'")
-                                    await elem.click(timeout=5000)
-                                    await asyncio.sleep(random.uniform(3, 5))
-                                    return True
-                        except Exception:
-                            continue
-            except Exception:
-                continue
-        
-        # Engine-specific CSS selectors as fallback
-        if engine.lower() == 'google':
-            selectors = [
-                'a#pnnext',
-                'a[aria-label="Next"]',
-                'a[aria-label*="Next page"]',
-                'td[style*="text-align:left"] a',
-            ]
-        elif engine.lower() == 'bing':
-            selectors = [
-                'a[title="Next page"]',
-                'a[aria-label="Next"]',
-                'a.sb_pagN',
-                'a[href*="first="]',
-            ]
-        else:  # DuckDuckGo
-            selectors = [
-                'a.result--more__btn',
-                'a[href*="next"]',
-            ]
-        
-        # Generic patterns
-        selectors.extend([
-            'a[aria-label*="Next"]',
-            'button[aria-label*="Next"]',
-            'a.pagination__next',
-            'a.next',
-            'nav a:last-child',
-        ])
+        # Try text-based locators first (more reliable). Only links/buttons are
+        # likely pagination controls, so the filter is part of the same query
+        locator = page.locator("a, button").filter(has_text=_PAGINATION_TEXT_RE)
+        if await _click_first(locator, "pagination button"):
+            await _settle(page)
+            return True
         
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    is_visible = await element.is_visible()
-                    if is_visible:
-                        print(f"[webscrape] Found pagination button: {selector}")
-                        await element.click(timeout=5000)
-                        await asyncio.sleep(random.uniform(3, 5))
-                        return True
-            except Exception:
-                continue
+        # Engine-specific CSS selectors as fallback, OR-ed into a single query
+        css = _PAGINATION_CSS.get(engine.lower(), _PAGINATION_CSS['duckduckgo'])
+        if await _click_first(page.locator(css), "pagination button"):
+            await _settle(page)
+            return True
         
         return False
     except Exception as e:
@@ -400,167 +722,462 @@ async def _try_click_pagination(page, engine: str) -> bool:
         return False
 
 
-async def _scroll_and_collect_results(page, max_results: int, engine: str, search_term: str) -> List[Dict[str, str]]:
-    """Scroll through search results and collect data"""
-    collected: List[Dict[str, str]] = []
-    seen_urls = set()
+CSV_FIELDNAMES = (
+    'search_term', 'engine', 'rank', 'title', 'url',
+    'excerpt', 'publisher', 'date', 'scraped_at'
+)
+# Every collected row carries all columns but scraped_at, which is stamped per batch
+_ROW_VALUES = itemgetter(*CSV_FIELDNAMES[:-1])
+
+
+class _CsvSink:
+    """Append result rows to ./data/webscrape_<engine>_<term>.csv, opened once per run."""
+
+    def __init__(self, search_term: str, engine: str):
+        self.path = os.path.join(DATA_DIR, f"webscrape_{engine}_{_sanitize_filename(search_term)}.csv")
+        self.count = 0
+        self._f = None
+        self._w = None
+
+    def __enter__(self):
+        _ensure_dirs()
+        self._f = open(self.path, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+        self._w = csv.writer(self._f)
+        if os.path.getsize(self.path) == 0:
+            self._w.writerow(CSV_FIELDNAMES)
+        return self
+
+    def write_rows(self, rows: List[Dict[str, str]]):
+        if not rows:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        self._w.writerows((*_ROW_VALUES(r), now) for r in rows)
+        self.count += len(rows)
+        # Push each vision round's rows to the OS so a killed run keeps what it paid for
+        self._f.flush()
+
+    def __exit__(self, *exc):
+        self._f.close()
+        return False
+
+
+def _collect_rows(results: List[Dict], search_term: str, engine: str, seen_keys: set,
+                  collected: int, max_results: int) -> List[Dict[str, str]]:
+    """Turn new, titled results into CSV rows, stopping once collected reaches max_results
+
+    Results are deduplicated by URL, or by title for results without one, so
+    URL-less results do not all collapse into a single entry.
+    """
+    batch: List[Dict[str, str]] = []
+    for result in results:
+        url = result.get('url', '')
+        title = result.get('title', '').strip()
+        
+        # Skip if no title or already seen
+        if not title:
+            continue
+        key = url or hashlib.blake2b(title.lower().encode(), digest_size=8).digest()
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        
+        # Prepare data for CSV
+        row_data = {
+            'search_term': search_term,
+            'engine': engine,
+            'rank': result.get('rank', collected + len(batch) + 1),
+            'title': title,
+            'url': url,
+            'excerpt': result.get('excerpt', ''),
+            'publisher': result.get('publisher', ''),
+            'date': result.get('date', ''),
+        }
+        
+        batch.append(row_data)
+        print(f"[webscrape] ✓ Collected: {title[:50]}...")
+        
+        if collected + len(batch) >= max_results:
+            break
+    return batch
+
+
+async def _load_more_results(page, engine: str) -> bool:
+    """Bring more results into view: buttons first, then pagination, then scroll
+
+    Returns True if a pagination click moved the page to a new URL.
+    """
+    # First try "Load more" button
+    print(f"[webscrape] Checking for 'Load more' button...")
+    if await _try_click_load_more(page, engine):
+        return False
+    
+    # If no load more button, try pagination
+    print(f"[webscrape] Checking for pagination 'Next' button...")
+    url = page.url
+    if await _try_click_pagination(page, engine):
+        return page.url != url
+    
+    # Fall back to scrolling if no buttons found
+    print(f"[webscrape] No buttons found, scrolling to load more results...")
+    await page.evaluate('window.scrollBy(0, document.body.scrollHeight)')
+    await _settle(page)
+    return False
+
+
+async def _scroll_and_collect_results(page, max_results: int, engine: str, search_term: str,
+                                      sink: _CsvSink) -> int:
+    """Scroll through search results and collect data, writing each batch to sink
+
+    Rows go straight to the sink, whose count is the number collected so far;
+    only dedup keys are kept in memory. Returns the number of rows written.
+    """
+    seen_keys = set()
+    # Analyzed frames in a row that added no rows; three end the run
     fail_rounds = 0
-    scroll_count = 0
-    max_scrolls = 10  # Prevent infinite scrolling
+    # Captured frames in a row that were blank or unchanged; three stop capturing,
+    # but frames already buffered or in analysis are still consumed
+    stale_rounds = 0
+    frames = 0
+    # Load-more rounds since the page was last opened
+    rounds = 0
     
     # Token usage tracking
     total_tokens = 0
     total_cost = 0.0
 
-    while len(collected) < max_results and fail_rounds < 3 and scroll_count < max_scrolls:
-        print(f"\n[webscrape] Analyzing {engine} results... (collected: {len(collected)}/{max_results})")
-        
-        # Analyze current viewport with vision model
-        results, tokens_used, cost = await _analyze_search_results(page, engine)
+    # Frames are grouped into multi-image requests that are analyzed in the
+    # background while the page loads more results; results are consumed in
+    # capture order so ranks and dedup stay stable
+    limiter = _RateLimiter(VISION_RPM, VISION_TPM)
+    workers = asyncio.Semaphore(VISION_WORKERS)
+    pending: deque = deque()  # (task, frame count)
+    buffered: List[Tuple[bytes, int]] = []
+
+    async def analyze(group: List[Tuple[bytes, int]]):
+        async with workers:
+            await limiter.acquire(VISION_TOKENS_PER_CALL * len(group))
+            return await _analyze_frames(group, engine, search_term)
+
+    def flush():
+        pending.append((asyncio.create_task(analyze(list(buffered))), len(buffered)))
+        buffered.clear()
+
+    def take(pages: List[List[Dict]]):
+        nonlocal fail_rounds
+        for results in pages:
+            if sink.count >= max_results or fail_rounds >= 3:
+                return
+            batch = _collect_rows(results, search_term, engine, seen_keys, sink.count, max_results)
+            sink.write_rows(batch)
+
+            if not batch:
+                fail_rounds += 1
+                print(f"[webscrape] No new results found (fail round {fail_rounds}/3)")
+            else:
+                fail_rounds = 0
+
+    async def consume_next():
+        nonlocal total_tokens, total_cost
+        task, _ = pending.popleft()
+        pages, tokens_used, cost = await task
         total_tokens += tokens_used
         total_cost += cost
         
         print(f"[webscrape] Running totals - Tokens: {total_tokens:,}, Cost: ${total_cost:.4f}")
-        
-        new_count = 0
-        for result in results:
-            url = result.get('url', '')
-            title = result.get('title', '').strip()
-            
-            # Skip if no title or already seen
-            if not title or url in seen_urls:
+        take(pages)
+
+    # Frames already captured this run: exact digests, plus the previous frame's
+    # perceptual hash to catch viewports that differ only by ads or the cursor
+    seen_frames = set()
+    last_phash = None
+    # Results container handle, resolved once and reused across rounds
+    container = None
+    # False after a blank frame, so the same view is captured again once settled
+    advance = False
+
+    try:
+        while sink.count < max_results and fail_rounds < 3:
+            # Don't run further ahead than the remaining results could need
+            lookahead = min(VISION_WORKERS * VISION_FRAMES_PER_CALL,
+                            -(-(max_results - sink.count) // RESULTS_PER_FRAME))
+            in_flight = len(buffered) + sum(count for _, count in pending)
+            if frames < MAX_SCROLLS and stale_rounds < 3 and in_flight < lookahead:
+                if advance:
+                    navigated = await _load_more_results(page, engine)
+                    rounds += 1
+                    # Only a page reached by pagination can be reopened from its URL;
+                    # one grown in place would reload with just its first batch
+                    if navigated and rounds >= PAGE_RECYCLE_EVERY:
+                        page = await _recycle_page(page, engine)
+                        container = None
+                        rounds = 0
+                # Cards the DOM exposes directly need no vision call; earlier
+                # frames still in analysis are taken first to keep result order
+                dom_results = await _extract_dom_results(page, engine)
+                if dom_results:
+                    frames += 1
+                    advance = True
+                    print(f"[webscrape] Read {len(dom_results)} results from the page DOM")
+                    if buffered:
+                        flush()
+                    while pending:
+                        await consume_next()
+                    take([dom_results])
+                    continue
+                print(f"\n[webscrape] Capturing {engine} results... (collected: {sink.count}/{max_results})")
+                screenshot, container = await _capture_frame(page, engine, container)
+                frames += 1
+                advance = not _is_blank_frame(screenshot)
+                if not advance:
+                    stale_rounds += 1
+                    print(f"[webscrape] Screenshot is blank, waiting for the page (stale round {stale_rounds}/3)")
+                    await _settle(page)
+                    continue
+                digest = hashlib.blake2b(screenshot, digest_size=16).digest()
+                phash = _perceptual_hash(screenshot)
+                repeat = digest in seen_frames or (last_phash is not None and _same_frame(last_phash, phash))
+                seen_frames.add(digest)
+                last_phash = phash
+                if repeat:
+                    stale_rounds += 1
+                    print(f"[webscrape] Page did not change, skipping analysis (stale round {stale_rounds}/3)")
+                    continue
+                stale_rounds = 0
+                buffered.append((screenshot, phash))
+                if len(buffered) >= VISION_FRAMES_PER_CALL:
+                    flush()
                 continue
-                
-            seen_urls.add(url)
-            
-            # Random delay between processing results
-            delay = random.uniform(2, 5)
-            print(f"[webscrape] Processing result {len(collected)+1}, waiting {delay:.1f}s...")
-            await asyncio.sleep(delay)
-            
-            # Prepare data for CSV
-            row_data = {
-                'search_term': search_term,
-                'engine': engine,
-                'rank': result.get('rank', len(collected) + 1),
-                'title': title,
-                'url': url,
-                'excerpt': result.get('excerpt', ''),
-                'publisher': result.get('publisher', ''),
-                'date': result.get('date', ''),
-                'scraped_at': datetime.utcnow().isoformat()
-            }
-            
-            collected.append(row_data)
-            new_count += 1
-            print(f"[webscrape] ✓ Collected: {title[:50]}...")
-            
-            if len(collected) >= max_results:
+            # No more frames are coming for now: send what is buffered
+            if buffered:
+                flush()
+            if not pending:
                 break
-        
-        if new_count == 0:
-            fail_rounds += 1
-            print(f"[webscrape] No new results found (fail round {fail_rounds}/3)")
-        else:
-            fail_rounds = 0
-            
-        # Try to load more content: buttons first, then pagination, then scroll
-        if len(collected) < max_results and scroll_count < max_scrolls:
-            clicked = False
-            
-            # First try "Load more" button
-            print(f"[webscrape] Checking for 'Load more' button...")
-            clicked = await _try_click_load_more(page, engine)
-            
-            # If no load more button, try pagination
-            if not clicked:
-                print(f"[webscrape] Checking for pagination 'Next' button...")
-                clicked = await _try_click_pagination(page, engine)
-            
-            # Fall back to scrolling if no buttons found
-            if not clicked:
-                print(f"[webscrape] No buttons found, scrolling to load more results...")
-                await page.evaluate('window.scrollBy(0, document.body.scrollHeight)')
-                await asyncio.sleep(random.uniform(2, 4))
-            
-            scroll_count += 1
+            await consume_next()
+        # Requests already sent are paid for; wait for them so the totals are right
+        while pending:
+            await consume_next()
+    except BaseException:
+        for task, _ in pending:
+            task.cancel()
+        raise
 
     # Print total usage summary
     print(f"\n[webscrape] 📊 Total Token Usage Summary:")
     print(f"[webscrape] Total tokens used: {total_tokens:,}")
     print(f"[webscrape] Total estimated cost: ${total_cost:.4f}")
-    print(f"[webscrape] Average cost per result: ${total_cost/max(1, len(collected)):.4f}")
+    print(f"[webscrape] Average cost per result: ${total_cost/max(1, sink.count):.4f}")
 
-    return collected
+    return sink.count
 
 
-def _write_csv(search_term: str, engine: str, results: List[Dict[str, str]]):
-    """Write results to CSV file"""
-    _ensure_dirs()
-    sanitized_term = _sanitize_filename(search_term)
-    out_path = os.path.join(DATA_DIR, f"webscrape_{engine}_{sanitized_term}.csv")
+async def _capture_batch_frames(page, max_results: int, engine: str, search_term: str) -> Tuple[str, int]:
+    """Screenshot each scroll round into a Batch API input file; returns (path, frames)"""
+    batch_path = os.path.join(DATA_DIR, f"webscrape_batch_{engine}_{_sanitize_filename(search_term)}.jsonl")
+    want_frames = min(MAX_SCROLLS, -(-max_results // RESULTS_PER_FRAME) + 1)
+    frames = 0
+    last_hash = None
+    container = None
+    with open(batch_path, 'w', encoding='utf-8') as f:
+        for scroll_index in range(MAX_SCROLLS + 1):
+            screenshot, container = await _capture_frame(page, engine, container)
+            if _is_blank_frame(screenshot):
+                print("[webscrape] Screenshot is blank, waiting for the page")
+                await _settle(page)
+                continue
+            phash = _perceptual_hash(screenshot)
+            # A frame that did not change after loading more adds nothing to the job
+            if last_hash is None or not _same_frame(last_hash, phash):
+                f.write(json.dumps({
+                    "custom_id": str(scroll_index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": _vision_request(engine, [_encode_image(screenshot)]),
+                }) + "\n")
+                frames += 1
+                print(f"[webscrape] Queued frame {frames}/{want_frames} for batch analysis")
+            last_hash = phash
+            if frames >= want_frames or scroll_index == MAX_SCROLLS:
+                break
+            await _load_more_results(page, engine)
+    return batch_path, frames
+
+
+async def _collect_batch_results(client, batch_path: str, max_results: int, engine: str, search_term: str,
+                                 sink: _CsvSink):
+    """Submit captured frames as one Batch API job, wait for it, and write the results
+
+    The local input file is removed once the job is submitted and the uploaded
+    copy once it is finished. An interrupted wait cancels the job.
+    """
+    with open(batch_path, 'rb') as f:
+        input_file = await client.files.create(file=f, purpose="batch")
+    try:
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        os.remove(batch_path)
+        print(f"[webscrape] Submitted batch {batch.id}; waiting for it to complete...")
+        
+        delay = BATCH_POLL_INITIAL
+        try:
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                print(f"[webscrape] Batch status: {batch.status}, checking again in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BATCH_POLL_MAX)
+                batch = await client.batches.retrieve(batch.id)
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # A running job keeps billing after we stop waiting for it
+            print(f"\n[webscrape] Interrupted, cancelling batch {batch.id}")
+            await client.batches.cancel(batch.id)
+            raise
+    finally:
+        try:
+            await client.files.delete(input_file.id)
+        except Exception as e:
+            print(f"[webscrape] Could not delete uploaded batch input {input_file.id}: {e}")
     
-    fieldnames = [
-        'search_term', 'engine', 'rank', 'title', 'url', 
-        'excerpt', 'publisher', 'date', 'scraped_at'
-    ]
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"[webscrape] Batch {batch.id} ended with status '{batch.status}', no results")
+        for error in (batch.errors.data if batch.errors else None) or ():
+            line = f" (line {error.line})" if error.line is not None else ""
+            print(f"[webscrape]   {error.code}: {error.message}{line}")
+        if batch.error_file_id:
+            print(f"[webscrape] Per-request errors are in file {batch.error_file_id}")
+        return
     
-    now = datetime.utcnow().isoformat()
-    new_file = not os.path.exists(out_path)
+    output = await client.files.content(batch.output_file_id)
     
-    with open(out_path, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if new_file:
-            writer.writeheader()
-        for r in results:
-            row = {
-                'search_term': search_term,
-                'engine': engine,
-                'rank': r.get('rank', ''),
-                'title': r.get('title', ''),
-                'url': r.get('url', ''),
-                'excerpt': r.get('excerpt', ''),
-                'publisher': r.get('publisher', ''),
-                'date': r.get('date', ''),
-                'scraped_at': now
-            }
-            writer.writerow(row)
-    return out_path
-
-
-async def _run(search_term: str, max_results: int, engine: str):
-    """Main scraping function"""
-    _ensure_dirs()
-    async with async_playwright() as p:
-        ctx = await p.chromium.launch_persistent_context(
-            USER_DATA_DIR,
+    # Output lines come back in any order; custom_id is the scroll index
+    pages: Dict[int, List[Dict]] = {}
+    total_tokens = 0
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        body = (item.get("response") or {}).get("body") or {}
+        total_tokens += (body.get("usage") or {}).get("total_tokens", 0)
+        choices = body.get("choices") or []
+        if choices:
+            pages[int(item["custom_id"])] = _parse_results(choices[0]["message"]["content"])
+    
+    seen_keys = set()
+    for scroll_index in sorted(pages):
+        sink.write_rows(_collect_rows(pages[scroll_index], search_term, engine, seen_keys, sink.count, max_results))
+        if sink.count >= max_results:
+            break
+    
+    print(f"\n[webscrape] 📊 Batch used {total_tokens:,} tokens across {len(pages)} frames (billed at batch rates)")
+
+
+async def _open_results_page(ctx, url: str, engine: str):
+    """Open url in a new page of ctx, ready for screenshots"""
+    page = await ctx.new_page()
+    await page.route("**/*", _block_heavy_resources)
+    
+    print(f"\n[webscrape] Navigating to: {url}")
+    await page.goto(url, wait_until="domcontentloaded")
+    # Wait until the engine's results are on screen, not a fixed delay
+    selector = _RESULTS_READY_SELECTORS.get(engine.lower(), _RESULTS_READY_SELECTORS['duckduckgo'])
+    try:
+        await page.wait_for_selector(selector, state="visible", timeout=RESULTS_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        print(f"[webscrape] Results did not appear within {RESULTS_TIMEOUT_MS // 1000}s, continuing anyway")
+    return page
+
+
+async def _recycle_page(page, engine: str):
+    """Replace page with a fresh one at the same URL so its renderer memory is freed"""
+    url = page.url
+    ctx = page.context
+    await page.close()
+    print(f"[webscrape] Recycling page to cap memory use")
+    return await _open_results_page(ctx, url, engine)
+
+
+# Browser shared across webscrape invocations in one process. Playwright objects
+# are bound to the loop that created them, so commands run on _LOOP.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_PW = None
+_BROWSER = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+        atexit.register(_shutdown)
+    return _LOOP
+
+
+async def _get_browser():
+    """Launch Chromium once and hand it out on later calls."""
+    global _PW, _BROWSER
+    if _BROWSER is None or not _BROWSER.is_connected():
+        if _PW is None:
+            _PW = await async_playwright().start()
+        _BROWSER = await _PW.chromium.launch(
             headless=False,
             args=["--disable-blink-features=AutomationControlled"],
-            viewport={"width": 1280, "height": 900},
         )
-        page = await ctx.new_page()
-        
+    return _BROWSER
+
+
+async def _close_browser():
+    global _PW, _BROWSER
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        _BROWSER = None
+    if _PW is not None:
+        await _PW.stop()
+        _PW = None
+
+
+def _shutdown():
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        _LOOP.run_until_complete(_close_browser())
+    except Exception:
+        pass
+    _LOOP.close()
+
+
+async def _run(search_term: str, max_results: int, engine: str, batch_mode: bool = False):
+    """Main scraping function"""
+    _ensure_dirs()
+    # Batch mode needs the client only after the browser run; check it before paying for that
+    client = get_openai_client() if batch_mode else None
+    if batch_mode and not client:
+        raise RuntimeError("OpenAI client not available, batch job cannot be submitted")
+    browser = await _get_browser()
+    # A fresh context per scrape; closing it is what releases its memory
+    ctx = await browser.new_context(viewport=VIEWPORT, device_scale_factor=1)
+    try:
         # Generate search URL
         search_url = _get_search_url(search_term, engine)
-        print(f"\n[webscrape] Navigating to: {search_url}")
-        await page.goto(search_url, wait_until="domcontentloaded")
-        await asyncio.sleep(3)
-        
-        # Set moderate zoom (75%) to fit more content while maintaining readability
-        zoom_level = 0.75
-        try:
-            await page.evaluate(f'document.body.style.zoom = "{zoom_level}"')
-            print(f"[webscrape] Set zoom to {int(zoom_level * 100)}% for better content density")
-        except Exception as e:
-            print(f"[webscrape] Warning: Could not set zoom: {e}")
-
-        # Collect results
-        results = await _scroll_and_collect_results(page, max_results, engine, search_term)
-        out_path = _write_csv(search_term, engine, results)
+        page = await _open_results_page(ctx, search_url, engine)
 
+        # Collect results, appending each batch to the CSV as it arrives.
+        # Batch mode only captures frames here; analysis happens after the context closes
+        if batch_mode:
+            batch_path, frames = await _capture_batch_frames(page, max_results, engine, search_term)
+        else:
+            with _CsvSink(search_term, engine) as sink:
+                await _scroll_and_collect_results(page, max_results, engine, search_term, sink)
+    finally:
         await ctx.close()
 
-    return out_path, len(results)
+    if batch_mode:
+        with _CsvSink(search_term, engine) as sink:
+            if frames:
+                await _collect_batch_results(client, batch_path, max_results, engine, search_term, sink)
+            else:
+                os.remove(batch_path)
+
+    return sink.path, sink.count
 
 
 def webscrape_command(cli_instance, *args):
@@ -571,10 +1188,15 @@ def webscrape_command(cli_instance, *args):
         print(f"{Colors.YELLOW}Please run: pip install -r requirements.txt{Colors.END}")
         print(f"{Colors.YELLOW}Then: python -m playwright install chromium{Colors.END}")
         return
+    try:
+        _import_dependencies()
+    except ImportError as e:
+        print(f"{Colors.RED}Error: Could not load webscrape dependencies: {e}{Colors.END}")
+        return
 
     # Parse arguments
     if len(args) < 1:
-        print(f"{Colors.RED}Usage: webscrape \"<SEARCH TERM>\" <LIMIT> --location=<duckduckgo|google|bing>{Colors.END}")
+        print(f"{Colors.RED}Usage: webscrape \"<SEARCH TERM>\" <LIMIT> --location=<duckduckgo|google|bing> [--batch]{Colors.END}")
         print(f"{Colors.YELLOW}Examples:{Colors.END}")
         print(f"{Colors.YELLOW}  webscrape \"AI is getting scary\" 10 --location=duckduckgo{Colors.END}")
         print(f"{Colors.YELLOW}  webscrape \"climate change\" 20 --location=google{Colors.END}")
@@ -585,11 +1207,14 @@ def webscrape_command(cli_instance, *args):
     search_term = args[0].strip('"\'')  # Remove quotes
     limit = '10'
     location = 'duckduckgo'
+    batch_mode = False
     
     # Parse remaining arguments
     for i, arg in enumerate(args[1:], 1):
         if arg.startswith('--location='):
             location = arg.split('=', 1)[1]
+        elif arg == '--batch':
+            batch_mode = True
         elif arg.isdigit():
             limit = arg
         elif not arg.startswith('--'):
@@ -622,10 +1247,25 @@ def webscrape_command(cli_instance, *args):
     print(f"{Colors.WHITE}Search Term:{Colors.END} \"{search_term}\"")
     print(f"{Colors.WHITE}Engine:{Colors.END} {location.title()}")
     print(f"{Colors.WHITE}Limit:{Colors.END} {max_results}")
+    if batch_mode:
+        print(f"{Colors.WHITE}Mode:{Colors.END} Batch API (half price, results may take a while)")
     print(f"{Colors.MAGENTA}Features:{Colors.END} Vision analysis, multi-engine support, structured data extraction")
 
     try:
-        out_path, count = asyncio.run(_run(search_term, max_results, location))
+        loop = _get_loop()
+        task = loop.create_task(_run(search_term, max_results, location, batch_mode))
+        try:
+            out_path, count = loop.run_until_complete(task)
+        except KeyboardInterrupt:
+            # Ctrl-C usually lands outside the task; cancel it so it can clean up
+            # (e.g. cancel a submitted batch job) before the CLI exits
+            if not task.done():
+                task.cancel()
+                try:
+                    loop.run_until_complete(task)
+                except BaseException:
+                    pass
+            raise
         print(f"\n{Colors.GREEN}✓ Scraped {count} results from {location.title()}. CSV: {out_path}{Colors.END}")
         print(f"{Colors.CYAN}Columns: search_term, engine, rank, title, url, excerpt, publisher, date, scraped_at{Colors.END}")
     except Exception as e:
@@ -642,7 +1282,7 @@ PLUGIN_INFO = {
         'webscrape': {
             'handler': webscrape_command,
             'description': 'Scrape search results from DuckDuckGo, Google, or Bing',
-            'usage': 'webscrape "<SEARCH TERM>" <LIMIT> --location=<duckduckgo|google|bing>'
+            'usage': 'webscrape "<SEARCH TERM>" <LIMIT> --location=<duckduckgo|google|bing> [--batch]'
         }
     }
 }
@@ -7,12 +7,22 @@ import argparse
 import shlex
 import sys
 import time
-import random
 import os
-import importlib.util
-from typing import List, Optional, Dict, Any
-import threading
-from datetime import datetime
+import re
+import json
+from functools import lru_cache
+from itertools import cycle, islice
+import operator
+from typing import List
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+# Plugin metadata from the last run, so unchanged plugins are not executed
+# at startup; each plugin is imported when one of its commands first runs
+PLUGIN_MANIFEST_PATH = os.path.join(os.path.expanduser('~'), '.psyduck', 'cache', 'plugins.json')
 
 class Colors:
     """ANSI color codes for terminal styling"""
@@ -26,16 +36,50 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
     END = '\033[0m'
+    
+    @classmethod
+    def disable(cls):
+        """Blank every code, for output that is not going to a terminal"""
+        for name in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'WHITE', 'BOLD', 'UNDERLINE', 'END'):
+            setattr(cls, name, '')
 
-class PsyduckCLI:
-    def __init__(self):
-        self.running = False
-        self.plugins = {}
-        self.load_plugins()
-        
-    def print_banner(self):
-        """Display the Psyduck banner"""
-        banner = f"""
+PSYDUCK_FACTS = (
+    "Psyduck is a Water-type Pokémon known for its constant headaches.",
+    "When Psyduck's headache peaks, it unleashes tremendous psychic power.",
+    "Psyduck's vacant expression is actually a sign of intense concentration.",
+    "In the anime, Misty's Psyduck often appears at the most inconvenient times.",
+    "Psyduck evolves into Golduck when exposed to a Water Stone.",
+    "Despite its confused appearance, Psyduck is actually quite intelligent.",
+    "Psyduck's psychic powers are strongest when it has a headache.",
+    "The yellow duck Pokémon is often misunderstood due to its expression.",
+)
+SYSTEM_COMMANDS = ('help', 'exit')
+SPINNER_CHARS = ('⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏')
+RAINBOW_COLORS = (Colors.RED, Colors.YELLOW, Colors.GREEN, Colors.CYAN, Colors.BLUE, Colors.MAGENTA)
+
+# Back-to-back SGR sequences, e.g. BOLD then CYAN
+_SGR_RUN_RE = re.compile(r'(?:\033\[[0-9;]+m){2,}')
+
+def _compact_sgr(text):
+    """Merge runs of SGR escape sequences into one, e.g. BOLD + CYAN into ESC[1;96m"""
+    return _SGR_RUN_RE.sub(
+        lambda m: '\033[' + ';'.join(re.findall(r'\[([0-9;]+)m', m.group())) + 'm', text
+    )
+
+@lru_cache(maxsize=1)
+def _menu_header():
+    """Static top of the main menu; built on first use"""
+    return _compact_sgr(f"""
+{Colors.BOLD}{Colors.CYAN}╔══════════════════════════════════════╗
+║              MAIN MENU              ║
+╚══════════════════════════════════════╝{Colors.END}
+
+{Colors.WHITE}Available Commands:{Colors.END}""")
+
+@lru_cache(maxsize=1)
+def _banner():
+    """The banner text; built on first use, after any color setup"""
+    return f"""
 {Colors.YELLOW}
 ⠀⠀⠀⠀⠀⠀⠀⠀⣤⡀⠀⣶⡄⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
 ⠀⠀⠀⠀⠀⠀⠀⠀⠙⣿⣆⣿⡇⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
@@ -58,88 +102,180 @@ class PsyduckCLI:
 {Colors.BOLD}PSYDUCK CLI v1.0.0{Colors.END}
 {Colors.WHITE}AI OSINT Tool for you & I{Colors.END}
         """
-        print(banner)
+
+def _animations_enabled():
+    """Animations only pay off on a terminal; PSYDUCK_NO_ANIM turns them off"""
+    return sys.stdout.isatty() and not os.getenv('PSYDUCK_NO_ANIM')
+
+def _read_plugin_manifest():
+    try:
+        with open(PLUGIN_MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _write_plugin_manifest(manifest):
+    try:
+        os.makedirs(os.path.dirname(PLUGIN_MANIFEST_PATH), exist_ok=True)
+        tmp_path = PLUGIN_MANIFEST_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, PLUGIN_MANIFEST_PATH)
+    except (OSError, TypeError, ValueError):
+        pass
+
+def _plugin_metadata(plugin_info):
+    """PLUGIN_INFO without its handlers, for the manifest"""
+    metadata = {key: value for key, value in plugin_info.items() if key != 'commands'}
+    metadata['commands'] = {
+        cmd_name: {key: value for key, value in cmd_info.items()
+                   if key != 'handler' and not key.startswith('_')}
+        for cmd_name, cmd_info in plugin_info.get('commands', {}).items()
+    }
+    return metadata
+
+class PsyduckCLI:
+    def __init__(self):
+        self.running = False
+        self.plugins = {}
+        # Plugins registered from the manifest and not imported yet: name -> (dir name, main.py)
+        self._lazy_plugins = {}
+        self.load_plugins()
+        self._build_command_table()
+        
+    def print_banner(self):
+        """Display the Psyduck banner"""
+        sys.stdout.write(_banner() + "\n")
+        sys.stdout.flush()
     
-    def loading_spinner(self, message: str = "Loading", duration: float = 3.0):
-        """Display a loading spinner with message"""
-        spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-        end_time = time.time() + duration
+    def loading_spinner(self, message: str = "Loading", duration: float = 3.0, work_fn=None):
+        """Display a loading spinner with message
         
-        print(f"\n{Colors.YELLOW}{message}...{Colors.END}", end='', flush=True)
+        With work_fn, the spinner runs until work_fn (called on a worker thread)
+        returns instead of for duration, and its result is returned.
+        """
+        if not _animations_enabled():
+            result = work_fn() if work_fn else None
+            print(f"\n{Colors.GREEN}{message}... ✓{Colors.END}")
+            return result
         
-        while time.time() < end_time:
-            for char in spinner_chars:
-                if time.time() >= end_time:
-                    break
-                print(f"\r{Colors.YELLOW}{message}... {char}{Colors.END}", end='', flush=True)
-                time.sleep(0.1)
+        # Only the spinner glyph changes, so every frame is formatted up front
+        frames = tuple(f"\r{Colors.YELLOW}{message}... {char}{Colors.END}" for char in SPINNER_CHARS)
+        write, flush = sys.stdout.write, sys.stdout.flush
+        outcome = {}
         
-        print(f"\r{Colors.GREEN}{message}... ✓{Colors.END}")
+        if work_fn:
+            import threading
+            
+            done = threading.Event()
+            
+            def run():
+                try:
+                    outcome['result'] = work_fn()
+                except BaseException as e:
+                    outcome['error'] = e
+                finally:
+                    done.set()
+            
+            threading.Thread(target=run, daemon=True).start()
+            finished, pause = done.is_set, done.wait  # wakes as soon as the work ends
+        else:
+            monotonic = time.monotonic
+            end_time = monotonic() + duration
+            finished, pause = (lambda: monotonic() >= end_time), time.sleep
+        
+        write(f"\n{Colors.YELLOW}{message}...{Colors.END}")
+        flush()
+        
+        i = 0
+        while not finished():
+            write(frames[i])
+            flush()
+            i = (i + 1) % len(frames)
+            pause(0.1)
+        
+        if 'error' in outcome:
+            write(f"\r{Colors.RED}{message}... ✗{Colors.END}\n")
+            flush()
+            raise outcome['error']
+        write(f"\r{Colors.GREEN}{message}... ✓{Colors.END}\n")
+        flush()
+        return outcome.get('result')
     
     def progress_bar(self, message: str = "Processing", duration: float = 3.0, width: int = 40):
         """Display a progress bar with percentage"""
         print(f"\n{Colors.BLUE}{message}:{Colors.END}")
+        if not _animations_enabled():
+            print(f"{Colors.GREEN}✓ {message} completed!{Colors.END}")
+            return
         
+        # Every frame is a slice of the same two bars
+        filled = '█' * width
+        empty = '░' * width
+        prefix = f"\r{Colors.CYAN}["
+        step = duration / width
+        write, flush = sys.stdout.write, sys.stdout.flush
         for i in range(width + 1):
-            percentage = int((i / width) * 100)
-            filled = '█' * i
-            empty = '░' * (width - i)
-            
-            print(f"\r{Colors.CYAN}[{filled}{empty}] {percentage:3d}%{Colors.END}", end='', flush=True)
-            time.sleep(duration / width)
+            percentage = i * 100 // width
+            write(f"{prefix}{filled[:i]}{empty[i:]}] {percentage:3d}%{Colors.END}")
+            flush()
+            time.sleep(step)
         
-        print(f"\n{Colors.GREEN}✓ {message} completed!{Colors.END}")
+        write(f"\n{Colors.GREEN}✓ {message} completed!{Colors.END}\n")
+        flush()
     
     def typewriter_effect(self, text: str, delay: float = 0.05):
         """Display text with typewriter effect"""
+        if delay <= 0 or not _animations_enabled():
+            print(text)
+            return
+        
+        write, flush = sys.stdout.write, sys.stdout.flush
         for char in text:
-            print(char, end='', flush=True)
+            write(char)
+            flush()
             time.sleep(delay)
-        print()
+        write('\n')
+        flush()
     
     def rainbow_text(self, text: str):
         """Display text in rainbow colors"""
-        colors = [Colors.RED, Colors.YELLOW, Colors.GREEN, Colors.CYAN, Colors.BLUE, Colors.MAGENTA]
-        result = ""
+        if not Colors.END:
+            return text
         
-        for i, char in enumerate(text):
-            if char == ' ':
-                result += ' '
-            else:
-                color = colors[i % len(colors)]
-                result += f"{color}{char}{Colors.END}"
-        
-        return result
+        # Each color code overrides the previous one, so a single reset at the
+        # end is enough. Pairing codes with characters via map/cycle keeps the
+        # loop in C; spaces get a code too, which is invisible on screen.
+        colored = ''.join(map(operator.add, islice(cycle(RAINBOW_COLORS), len(text)), text))
+        return colored + Colors.END if text else colored
     
     def show_menu(self):
         """Display the main menu"""
         commands = self.get_available_commands()
+        # Locals for the codes used on every command line
+        green, cyan, end = Colors.GREEN, Colors.CYAN, Colors.END
         
-        menu_text = f"""
-{Colors.BOLD}{Colors.CYAN}╔══════════════════════════════════════╗
-║              MAIN MENU              ║
-╚══════════════════════════════════════╝{Colors.END}
-
-{Colors.WHITE}Available Commands:{Colors.END}"""
+        parts = [_menu_header()]
         
         # System commands
-        system_commands = ['help', 'exit']
-        for cmd in system_commands:
+        for cmd in SYSTEM_COMMANDS:
             if cmd in commands:
-                menu_text += f"\n  {Colors.GREEN}{cmd:<12}{Colors.END} - {commands[cmd]}"
+                parts.append(f"  {green}{cmd:<12}{end} - {commands[cmd]}")
         
         # Plugin commands
-        plugin_commands = [cmd for cmd in commands.keys() if cmd not in system_commands]
-        if plugin_commands:
-            menu_text += f"\n\n{Colors.MAGENTA}Plugin Commands:{Colors.END}"
-            for cmd in sorted(plugin_commands):
-                menu_text += f"\n  {Colors.CYAN}{cmd:<12}{Colors.END} - {commands[cmd]}"
-        
-        menu_text += f"\n\n{Colors.YELLOW}Usage: psyduck <command> [options]{Colors.END}"
-        print(menu_text)
+        if self._plugin_commands:
+            parts.append(f"\n{Colors.MAGENTA}Plugin Commands:{Colors.END}")
+            parts.extend(f"  {cyan}{cmd:<12}{end} - {commands[cmd]}" for cmd in self._plugin_commands)
+        
+        parts.append(f"\n{Colors.YELLOW}Usage: psyduck <command> [options]{Colors.END}\n")
+        sys.stdout.write('\n'.join(parts))
+        sys.stdout.flush()
     
     def show_time(self):
         """Display current time with styling"""
+        from datetime import datetime
+        
         now = datetime.now()
         time_str = now.strftime("%Y-%m-%d %H:%M:%S")
         
@@ -148,18 +284,9 @@ class PsyduckCLI:
     
     def random_fact(self):
         """Display a random Psyduck fact"""
-        facts = [
-            "Psyduck is a Water-type Pokémon known for its constant headaches.",
-            "When Psyduck's headache peaks, it unleashes tremendous psychic power.",
-            "Psyduck's vacant expression is actually a sign of intense concentration.",
-            "In the anime, Misty's Psyduck often appears at the most inconvenient times.",
-            "Psyduck evolves into Golduck when exposed to a Water Stone.",
-            "Despite its confused appearance, Psyduck is actually quite intelligent.",
-            "Psyduck's psychic powers are strongest when it has a headache.",
-            "The yellow duck Pokémon is often misunderstood due to its expression."
-        ]
-        
-        fact = random.choice(facts)
+        import random
+        
+        fact = random.choice(PSYDUCK_FACTS)
         print(f"\n{Colors.BOLD}{Colors.YELLOW}🦆 Random Psyduck Fact:{Colors.END}")
         print(f"{Colors.WHITE}{fact}{Colors.END}")
     
@@ -169,7 +296,8 @@ class PsyduckCLI:
         
         # Typewriter effect
         self.typewriter_effect(f"{Colors.CYAN}Welcome to the Psyduck CLI demo!{Colors.END}")
-        time.sleep(1)
+        if _animations_enabled():
+            time.sleep(1)
         
         # Loading spinner
         self.loading_spinner("Initializing Psyduck", 2.0)
@@ -189,50 +317,111 @@ class PsyduckCLI:
         
         print(f"\n{Colors.GREEN}✓ Demo completed!{Colors.END}")
     
+    def _import_plugin(self, item: str, main_file: str):
+        """Execute a plugin's main.py and return its PLUGIN_INFO (None if missing)"""
+        # Only needed when a plugin is actually imported, not for manifest hits
+        import importlib.util
+        import inspect
+        
+        module_name = f"plugin.{item}"
+        # A plugin already imported in this process (e.g. by an earlier
+        # PsyduckCLI instance) is reused rather than executed again
+        plugin_module = sys.modules.get(module_name)
+        if plugin_module is None:
+            spec = importlib.util.spec_from_file_location(module_name, main_file)
+            plugin_module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = plugin_module
+            try:
+                spec.loader.exec_module(plugin_module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+        plugin_info = getattr(plugin_module, 'PLUGIN_INFO', None)
+        if plugin_info:
+            # Whether each handler takes command arguments, decided once here
+            # rather than with inspect.signature on every dispatch
+            for cmd_info in plugin_info.get('commands', {}).values():
+                if 'handler' in cmd_info:
+                    cmd_info['_accepts_args'] = len(inspect.signature(cmd_info['handler']).parameters) > 1
+        return plugin_info
+    
     def load_plugins(self):
-        """Load all plugins from the plugin directory"""
+        """Load all plugins from the plugin directory
+        
+        A plugin whose main.py is unchanged since it was last imported is
+        registered from the manifest; its module is imported on first use.
+        """
         plugin_dir = os.path.join(os.path.dirname(__file__), 'plugin')
         
         if not os.path.exists(plugin_dir):
             return
         
-        for item in os.listdir(plugin_dir):
-            plugin_path = os.path.join(plugin_dir, item)
-            if os.path.isdir(plugin_path) and not item.startswith('__'):
-                main_file = os.path.join(plugin_path, 'main.py')
-                if os.path.exists(main_file):
-                    try:
-                        spec = importlib.util.spec_from_file_location(f"plugin.{item}", main_file)
-                        plugin_module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(plugin_module)
-                        
-                        if hasattr(plugin_module, 'PLUGIN_INFO'):
-                            plugin_info = plugin_module.PLUGIN_INFO
-                            self.plugins[plugin_info['name']] = plugin_info
-                            # Only show loading message in interactive mode
-                            if hasattr(self, '_show_loading_messages'):
-                                print(f"{Colors.GREEN}✓ Loaded plugin: {plugin_info['name']}{Colors.END}")
-                        else:
-                            if hasattr(self, '_show_loading_messages'):
-                                print(f"{Colors.YELLOW}⚠ Plugin {item} missing PLUGIN_INFO{Colors.END}")
-                    except Exception as e:
-                        if hasattr(self, '_show_loading_messages'):
-                            print(f"{Colors.RED}✗ Failed to load plugin {item}: {e}{Colors.END}")
+        # Plugins read API keys from .env; load it here since cached plugins
+        # are no longer imported (and cannot load it themselves) at startup
+        if load_dotenv:
+            load_dotenv()
+        
+        manifest = _read_plugin_manifest()
+        fresh_manifest = {}
+        
+        # scandir yields each entry's type, so only main.py needs a stat call
+        with os.scandir(plugin_dir) as entries:
+            plugin_dirs = [entry for entry in entries if entry.is_dir() and not entry.name.startswith('__')]
+        
+        for entry in plugin_dirs:
+            item = entry.name
+            main_file = os.path.join(entry.path, 'main.py')
+            try:
+                mtime = os.stat(main_file).st_mtime_ns
+            except OSError:
+                continue
+            try:
+                cached = manifest.get(main_file)
+                if cached and cached.get('mtime') == mtime:
+                    plugin_info = cached['info']
+                    self._lazy_plugins[plugin_info['name']] = (item, main_file)
+                    fresh_manifest[main_file] = cached
+                else:
+                    plugin_info = self._import_plugin(item, main_file)
+                    if plugin_info:
+                        fresh_manifest[main_file] = {'mtime': mtime, 'info': _plugin_metadata(plugin_info)}
+                
+                if plugin_info:
+                    self.plugins[plugin_info['name']] = plugin_info
+                    # Only show loading message in interactive mode
+                    if hasattr(self, '_show_loading_messages'):
+                        print(f"{Colors.GREEN}✓ Loaded plugin: {plugin_info['name']}{Colors.END}")
+                else:
+                    if hasattr(self, '_show_loading_messages'):
+                        print(f"{Colors.YELLOW}⚠ Plugin {item} missing PLUGIN_INFO{Colors.END}")
+            except Exception as e:
+                if hasattr(self, '_show_loading_messages'):
+                    print(f"{Colors.RED}✗ Failed to load plugin {item}: {e}{Colors.END}")
+        
+        if fresh_manifest != manifest:
+            _write_plugin_manifest(fresh_manifest)
     
-    def get_available_commands(self):
-        """Get all available commands including plugin commands"""
-        commands = {
+    def _build_command_table(self):
+        """Map each command to the plugin that handles it, and cache the menu descriptions"""
+        self._command_table = {}
+        self._commands_desc = {
             'help': 'Show this menu',
             'exit': 'Exit the application'
         }
         
-        # Add plugin commands
+        # Add plugin commands; the first plugin to declare a command handles it
         for plugin_name, plugin_info in self.plugins.items():
             if 'commands' in plugin_info:
                 for cmd_name, cmd_info in plugin_info['commands'].items():
-                    commands[cmd_name] = cmd_info['description']
+                    self._command_table.setdefault(cmd_name, plugin_name)
+                    self._commands_desc[cmd_name] = cmd_info['description']
         
-        return commands
+        # Menu order for plugin commands
+        self._plugin_commands = sorted(cmd for cmd in self._commands_desc if cmd not in SYSTEM_COMMANDS)
+    
+    def get_available_commands(self):
+        """Get all available commands including plugin commands"""
+        return self._commands_desc
     
     def execute_command(self, command: str, args: List[str] = None):
         """Execute a command, checking plugins first"""
@@ -240,22 +429,31 @@ class PsyduckCLI:
             args = []
             
         # Check if command exists in plugins
-        for plugin_name, plugin_info in self.plugins.items():
-            if 'commands' in plugin_info and command in plugin_info['commands']:
-                cmd_info = plugin_info['commands'][command]
-                if 'handler' in cmd_info:
-                    try:
-                        # Pass arguments to handler if it accepts them
-                        import inspect
-                        sig = inspect.signature(cmd_info['handler'])
-                        if len(sig.parameters) > 1:  # More than just cli_instance
-                            cmd_info['handler'](self, *args)
-                        else:
-                            cmd_info['handler'](self)
-                        return True
-                    except Exception as e:
-                        print(f"{Colors.RED}Error executing plugin command {command}: {e}{Colors.END}")
-                        return False
+        plugin_name = self._command_table.get(command)
+        if plugin_name is not None:
+            plugin_info = self.plugins[plugin_name]
+            if plugin_name in self._lazy_plugins:
+                item, main_file = self._lazy_plugins.pop(plugin_name)
+                try:
+                    plugin_info = self._import_plugin(item, main_file)
+                except Exception as e:
+                    print(f"{Colors.RED}✗ Failed to load plugin {item}: {e}{Colors.END}")
+                    return False
+                if not plugin_info or command not in plugin_info.get('commands', {}):
+                    return False
+                self.plugins[plugin_name] = plugin_info
+            cmd_info = plugin_info['commands'][command]
+            if 'handler' in cmd_info:
+                try:
+                    # Pass arguments to handler if it accepts them
+                    if cmd_info['_accepts_args']:  # More than just cli_instance
+                        cmd_info['handler'](self, *args)
+                    else:
+                        cmd_info['handler'](self)
+                    return True
+                except Exception as e:
+                    print(f"{Colors.RED}Error executing plugin command {command}: {e}{Colors.END}")
+                    return False
         
         # Handle system commands
         if command == 'help' or command == '':
@@ -323,6 +521,9 @@ Examples:
                        help='Arguments for the command (use quotes to group)')
     
     args = parser.parse_args()
+    # Piped or redirected output gets plain text instead of escape codes
+    if not sys.stdout.isatty():
+        Colors.disable()
     cli = PsyduckCLI()
     
     if args.command == 'interactive':
@@ -335,4 +536,7 @@ Examples:
             sys.exit(1)
 
 if __name__ == "__main__":
+    # Plugins do `from psyduck import Colors`; resolve that to this module
+    # instead of importing psyduck.py a second time with its own Colors
+    sys.modules.setdefault('psyduck', sys.modules[__name__])
     main()